@@ -0,0 +1,54 @@
+# -*- coding:utf-8 -*-
+"""bytes per bound field, after rendering a form with a large nested list.
+
+    $ python benchmarks/bench_memory.py [rows]
+"""
+import gc
+import sys
+import tracemalloc
+import marshmallow_form as mf
+
+
+class CommentForm(mf.Form):
+    author = mf.String()
+    body = mf.String()
+    score = mf.Int()
+
+
+class ArticleForm(mf.Form):
+    title = mf.String()
+    comments = mf.Nested(CommentForm, many=True)
+
+
+def render(form):
+    seen = set()
+    for f in form:
+        seen.add(id(f))
+        for bf in f:
+            bf.value, bf.metadata, bf.errors
+            seen.add(id(bf))
+    return len(seen)
+
+
+def main(rows=1000):
+    data = {"title": "foo", "comments": [{"author": "a", "body": "b", "score": i} for i in range(rows)]}
+    ArticleForm.warmup()
+    render(ArticleForm(initial={"title": "x", "comments": data["comments"][:1]}))
+
+    gc.collect()
+    tracemalloc.start()
+    form = ArticleForm.from_object(data)
+    before = tracemalloc.take_snapshot()
+    n = render(form)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    print("bound fields: {}, bytes: {}, bytes per bound field: {:.1f}".format(n, size, float(size) / n))
+
+    bf = form.title
+    instance = sys.getsizeof(bf) + (sys.getsizeof(bf.__dict__) if hasattr(bf, "__dict__") else 0)
+    print("BoundField instance (with its __dict__, if any): {} bytes".format(instance))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
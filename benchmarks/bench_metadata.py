@@ -0,0 +1,43 @@
+# -*- coding:utf-8 -*-
+"""memory used by defining many forms whose fields share the same metadata.
+
+    $ python benchmarks/bench_metadata.py [forms] [fields]
+"""
+import gc
+import sys
+import resource
+import tracemalloc
+from functools import partial
+import marshmallow_form as mf
+
+Int = partial(mf.Int, type="number", widget="int")
+Str = partial(mf.Str, type="text", widget="str")
+
+
+def define_forms(n, m):
+    forms = []
+    for i in range(n):
+        attrs = {}
+        for j in range(m):
+            attrs["s{}".format(j)] = Str()
+            attrs["i{}".format(j)] = Int()
+        forms.append(mf.FormMeta("Form{}".format(i), (mf.Form, ), attrs))
+    return forms
+
+
+def main(n=200, m=10):
+    define_forms(1, 1)
+    gc.collect()
+    tracemalloc.start()
+    forms = define_forms(n, m)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    nfields = n * m * 2
+    print("forms: {}, fields: {}, bytes: {}, bytes per field: {:.1f}".format(n, nfields, size, float(size) / nfields))
+    print("maxrss: {} KiB".format(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+    return forms
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,36 @@
+# -*- coding:utf-8 -*-
+from collections import OrderedDict
+from marshmallow.compat import basestring
+
+
+def column(rows, key):
+    return OrderedDict((i, row[key]) for i, row in enumerate(rows) if hasattr(row, "get") and key in row)
+
+
+def validate(schema, rows, validators=None):
+    """running batch validators of schema, returning per-row errors: {<row index>: {<key>: [message]}}"""
+    errors = OrderedDict()
+    for name, fn in (schema.__batch_validators__ if validators is None else validators):
+        field = schema.fields.get(name)
+        if field is None:  # excluded by only/exclude options
+            continue
+        key = field.attribute or name
+        values = column(rows, key)
+        if not values:
+            continue
+        for i, messages in (fn(schema, values) or {}).items():
+            if isinstance(messages, basestring):
+                messages = [messages]
+            errors.setdefault(i, {}).setdefault(key, []).extend(messages)
+    return errors
+
+
+def merge(errors, batch_errors, many):
+    """adding batch errors to errors of schema.load(). (for many=False, the errors of row 0 are merged)"""
+    if many:
+        for i, d in batch_errors.items():
+            errors.setdefault(i, {}).update(d)
+    else:
+        for key, messages in batch_errors.get(0, {}).items():
+            errors.setdefault(key, []).extend(messages)
+    return errors
@@ -3,18 +3,23 @@ import copy
 from collections import ChainMap
 from marshmallow.compat import text_type
 from .lazylist import LazyList
-from .langhelpers import reify, Counter
+from .langhelpers import slot_reify, slot_generational_reify, Counter, Overlay, InternTable
 
 
 def field(fieldclass, *args, **kwargs):
-    return Field(fieldclass(*args, **kwargs))
+    f = fieldclass(*args, **kwargs)
+    f.metadata = intern_metadata(f.metadata)
+    return Field(f)
 
 
 C = Counter(0)
+intern_metadata = InternTable()  # equal metadata of fields are shared (read only)
 MARKER = object()  # adhoc
 
 
 class Field(object):
+    __slots__ = ("field", "name", "_c")
+
     def __init__(self, field, name=None):
         self.field = field
         self.name = name
@@ -27,41 +32,58 @@ class Field(object):
         if ob is None:
             return self
         name = self.name
-        field = ob.schema.fields[name]
-        bf = bound_field(name, field, ob, overrides=ob.metadata.get(name))
+        fields_dict = ob.current_schema.fields
+        if name not in fields_dict:  # removed
+            raise AttributeError(name)
+        field = fields_dict[name]
+        table = ob.field_metadata
+        bf = bound_field(name, field, ob._form_state, overrides=ob.metadata.get(name), table=table)
         ob.__dict__[name] = bf
         return bf
 
 
-def bound_field(name, field, ob, key=None, overrides=None, parent_errors=None):
+def bound_field(name, field, ob, key=None, overrides=None, parent_errors=None, table=None):
     parent_errors = parent_errors or set()
+    # table is precomputed metadata ({<dotted name>: <frozen metadata>}), see FormMeta.flatten_metadata()
+    flat = table.get(name) if table else None
     if hasattr(field, "nested"):
         if field.many:
-            return NestedListBoundField(name, field, ob, overrides=overrides, parent_errors=parent_errors)
+            return NestedListBoundField(name, field, ob, overrides=overrides, parent_errors=parent_errors, flat=flat)
         else:
-            return NestedBoundField(name, field, ob, key=key, overrides=overrides, parent_errors=parent_errors)
+            return NestedBoundField(name, field, ob, key=key, overrides=overrides, parent_errors=parent_errors,
+                                    flat=flat, table=table)
     else:
-        return BoundField(name, field, ob, key=key, overrides=overrides, parent_errors=parent_errors)
+        return BoundField(name, field, ob, key=key, overrides=overrides, parent_errors=parent_errors, flat=flat)
 
 
 class BoundField(object):
-    def __init__(self, name, field, form, key=None, overrides=None, parent_errors=None):
+    __slots__ = ("name", "key", "field", "form", "overrides", "parent_errors", "_flat",
+                 "_metadata", "_choices", "_value")
+
+    def __init__(self, name, field, form, key=None, overrides=None, parent_errors=None, flat=None):
         self.name = name
         self.key = key or name
         self.field = field
         self.form = form
         self.overrides = overrides
         self.parent_errors = parent_errors
+        self._flat = flat
 
     def __iter__(self):
         yield self
 
-    @reify
+    @property
+    def _form_generation(self):  # (not "generation", it can be a name of nested field)
+        return self.form.generation
+
+    @slot_reify("_metadata")
     def metadata(self):
+        if self._flat is not None:
+            return Overlay(self._flat)
         if self.overrides:
             return ChainMap(self.overrides, self.field.metadata)
         else:
-            return self.field.metadata
+            return Overlay(self.field.metadata)
 
     @property
     def errors(self):
@@ -80,12 +102,15 @@ class BoundField(object):
         return self.form.itemgetter(self.metadata, k)
 
     def __getattr__(self, k):
+        # falling back to marshmallow field's attributes (e.g. bf.required). never for private names
+        if k.startswith("_"):
+            raise AttributeError(k)
         return getattr(self.field, k, None) or []
 
     def disabled(self):
         self.metadata["disabled"] = True
 
-    @reify
+    @slot_reify("_choices")
     def choices(self):
         if "pairs" in self.metadata:
             return self.metadata["pairs"]
@@ -95,7 +120,7 @@ class BoundField(object):
         else:
             return []
 
-    @reify
+    @slot_generational_reify("_value", generation="_form_generation")
     def value(self):
         return (self.form.data.get(self.key)
                 or self.form.initial.get(self.key)
@@ -103,42 +128,98 @@ class BoundField(object):
                 or self.field.default)
 
 
-class SubForm(object):
-    def __init__(self, data, rawdata, errors, initial, itemgetter):
+class FormState(object):
+    """the part of a form that bound fields refer to.
+    bound fields do not refer to the form itself, so form -> bound fields has no reference cycles.
+    """
+    __slots__ = ("data", "rawdata", "errors", "initial", "itemgetter", "generation", "__weakref__")
+
+    def __init__(self, data=None, rawdata=None, errors=None, initial=None, itemgetter=None):
         self.data = data
         self.rawdata = rawdata
         self.errors = errors
         self.initial = initial
         self.itemgetter = itemgetter
+        self.generation = 0
+
+
+class SubForm(object):
+    __slots__ = ("itemgetter", "source", "_generation", "_state")
+
+    def __init__(self, data, rawdata, errors, initial, itemgetter, source=None):
+        self.itemgetter = itemgetter
+        self.source = source  # (name, parent form state). following the changes of parent form
+        self._generation = source[1].generation if source is not None else 0
+        self._state = (data, rawdata, errors, initial)
 
     @classmethod
     def from_form(cls, name, form, used_parent_errors=None):
+        return cls(*cls.extract(name, form), itemgetter=form.itemgetter, source=(name, form))
+
+    @staticmethod
+    def extract(name, form):
         if hasattr(form.data, "get"):
             data = (form.data.get(name) if form.data else None) or {}
             rawdata = (form.rawdata.get(name) if form.rawdata else None) or {}
         else:
-            data = form.data[name]
-            rawdata = form.rawdata[name]
+            try:
+                data = form.data[name]
+                rawdata = form.rawdata[name]
+            except (IndexError, KeyError):
+                data = rawdata = {}
 
         # errors are occured in parent form, errors dict is already flatten. so.
         errors = (form.errors.get(name) if hasattr(form.errors, "get") else None) or {}
 
         initial = (form.initial.get(name) if form.initial else None) or {}
-        return cls(data, rawdata, errors, initial, itemgetter=form.itemgetter)
+        return data, rawdata, errors, initial
+
+    def current(self):
+        if self.source is not None:
+            name, parent = self.source
+            generation = parent.generation
+            if generation != self._generation:
+                self._state = self.extract(name, parent)
+                self._generation = generation
+        return self._state
+
+    @property
+    def generation(self):
+        self.current()
+        return self._generation
+
+    @property
+    def data(self):
+        return self.current()[0]
+
+    @property
+    def rawdata(self):
+        return self.current()[1]
+
+    @property
+    def errors(self):
+        return self.current()[2]
+
+    @property
+    def initial(self):
+        return self.current()[3]
 
 
 class NestedBoundField(BoundField):
+    __slots__ = ("_name", "_table", "_children", "_bound_fields")
     allkey = "_schema"
 
-    def __init__(self, name, field, form, overrides=None, key=None, parent_errors=None):
+    def __init__(self, name, field, form, overrides=None, key=None, parent_errors=None, flat=None, table=None):
         self._name = name
         self.key = key if key is not None else name
         self.field = field
         self.form = form
         self.overrides = overrides
         self.parent_errors = parent_errors
+        self._flat = flat
+        self._table = table
 
-    @reify
+    @slot_reify("_children")
     def children(self):
         return copy.deepcopy(self.field.nested._declared_fields)
 
@@ -146,6 +227,10 @@ class NestedBoundField(BoundField):
     def errors(self):
         return (self.form.errors.get(self.key) or {}).get(self.allkey) or []
 
+    @slot_reify("_bound_fields")
+    def _bound(self):
+        return {}  # k -> (generation, bound field)
+
     def __iter__(self):
         for k in self.children.keys():
             for f in getattr(self, k):
@@ -154,11 +239,13 @@ class NestedBoundField(BoundField):
     def __getattr__(self, k):
         if k not in self.children:
             raise AttributeError(k)
-        subform = SubForm.from_form(self.key, self.form)
-        name = "{}.{}".format(self._name, k)
+        generation = self._form_generation
+        cached = self._bound.get(k)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
 
         # propagating parent form's errors. using via self.fullerrors
-        parent_errors = self.parent_errors
+        parent_errors = set(self.parent_errors or ())
         if self.form.errors is not None:
             if self.key in self.form.errors:
                 current_errors = self.form.errors[self.key]
@@ -169,31 +256,38 @@ class NestedBoundField(BoundField):
             if not hasattr(self.form.errors, "get"):
                 parent_errors.update(self.form.errors)
 
-        bf = bound_field(name, self.children[k], subform, key=k,
-                         overrides=self.metadata.get(k), parent_errors=parent_errors)
-        setattr(self, k, bf)
+        if cached is not None:
+            bf = cached[1]  # bound field follows the change of form, so only errors are updated
+            bf.parent_errors.clear()
+            bf.parent_errors.update(parent_errors)
+        else:
+            subform = SubForm.from_form(self.key, self.form)
+            name = "{}.{}".format(self._name, k)
+            bf = bound_field(name, self.children[k], subform, key=k,
+                             overrides=self.metadata.get(k), parent_errors=parent_errors, table=self._table)
+        self._bound[k] = (generation, bf)
         return bf
 
 
 class NestedListBoundField(BoundField):
-    def __init__(self, name, field, form, overrides=None, parent_errors=None):
+    __slots__ = ("_name", "_children")
+
+    def __init__(self, name, field, form, overrides=None, parent_errors=None, flat=None):
         self._name = name
         self.field = field
         self.form = form
         self.overrides = overrides
         self.parent_errors = parent_errors
+        self._flat = flat
 
-    @reify
+    @slot_generational_reify("_children", generation="_form_generation")
     def children(self):
-        initial = (self.form.initial.get(self._name) if self.form.initial else None) or {}
-        rawdata = (self.form.rawdata.get(self._name) if self.form.rawdata else None) or {}
-        errors = (self.form.errors.get(self._name) if self.form.errors else None) or {}
-        overrides = (self.overrides.get(self._name) if self.overrides else None) or {}
-        itemgetter = self.form.itemgetter
+        name = self._name
+        overrides = (self.overrides.get(name) if self.overrides else None) or {}
         field = self.field
-        data = self.form.data[self._name]
-        return LazyList(NestedBoundField("{}.{}".format(self._name, i), field, SubForm(data, rawdata, errors, initial, itemgetter=itemgetter), key=i, overrides=overrides)
-                        for i in range(len(data)))
+        subform = SubForm.from_form(name, self.form)
+        return LazyList(NestedBoundField("{}.{}".format(name, i), field, subform, key=i, overrides=overrides)
+                        for i in range(len(subform.data)))
 
     def __iter__(self):
         for c in self.children:
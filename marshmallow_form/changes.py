@@ -0,0 +1,85 @@
+# -*- coding:utf-8 -*-
+import hashlib
+from marshmallow import fields
+from marshmallow.fields import missing
+from marshmallow.exceptions import MarshallingError
+from .stream import _is_streamable, dump_rows, dump_whole, needs_whole_dump
+
+_computed = (fields.Method, fields.Function)  # the value is not an attribute of the object
+
+
+def _feed(h, schema, ob):
+    accessor = schema.__accessor__
+    for name, field in schema.fields.items():
+        _feed_field(h, name, field, ob, accessor)
+
+
+def _feed_field(h, name, field, ob, accessor):
+    h.update(name.encode("utf-8"))
+    if isinstance(field, _computed):
+        value = field.serialize(name, ob, accessor=accessor)
+    else:
+        value = field.get_value(name, ob, accessor=accessor)
+        if hasattr(field, "nested") and value is not None:
+            for sub in (value if field.many else (value, )):
+                h.update(b"\x1e")
+                _feed(h, field.schema, sub)
+            h.update(b"\x1d")
+            return
+    h.update(repr(value).encode("utf-8", "backslashreplace"))
+    h.update(b"\x1f")
+
+
+def fingerprint(schema, ob):
+    """digest of the source values of ob (repr() based, nested objects are included)"""
+    h = hashlib.sha1()
+    _feed(h, schema, ob)
+    return h.digest()
+
+
+def field_fingerprint(name, field, ob, accessor=None):
+    h = hashlib.sha1()
+    _feed_field(h, name, field, ob, accessor)
+    return h.digest()
+
+
+def dump_changes(schema, ob, since=None):
+    """serializing only the fields (and rows of Nested(many=True) fields) changed since the snapshot.
+    returning (patch, snapshot).
+
+    patch: {<key>: <value>} for changed fields, and {"<key>.<index>": <row>} for changed or appended rows.
+    (if rows are removed, the whole list is in patch as {<key>: [<row>, ...]})
+    snapshot: {<key>: <digest>} or {<key>: (<digest of row>, ...)}
+    """
+    since = since or {}
+    if needs_whole_dump(schema):
+        return dump_whole(schema, ob), {}
+
+    accessor = schema.__accessor__
+    prefix = schema.prefix
+    patch = schema.dict_class()
+    snapshot = {}
+    for name, field in schema.fields.items():
+        key = prefix + name
+        if _is_streamable(field):
+            rows = list(field.get_value(name, ob, accessor=accessor) or ())
+            digests = snapshot[key] = tuple(fingerprint(field.schema, row) for row in rows)
+            prev = since.get(key)
+            if not isinstance(prev, tuple) or len(prev) > len(digests):
+                patch[key] = list(dump_rows(key, field.schema, enumerate(rows)))
+            else:
+                changed = [(i, row) for i, row in enumerate(rows) if i >= len(prev) or prev[i] != digests[i]]
+                for (i, _), data in zip(changed, dump_rows(key, field.schema, changed)):
+                    patch["{}.{}".format(key, i)] = data
+            continue
+
+        digest = snapshot[key] = field_fingerprint(name, field, ob, accessor=accessor)
+        if since.get(key) == digest:
+            continue
+        try:
+            value = field.serialize(name, ob, accessor=accessor)
+        except MarshallingError as e:
+            raise MarshallingError({key: [str(e)]})
+        if value is not missing:
+            patch[key] = value
+    return patch, snapshot
@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+"""JSON encoding of serialized data, to bytes. orjson is used if installed (pip install marshmallow-form[fast])
+both encoders give the same output (non-str keys are converted, NaN and Infinity are null)
+"""
+import json
+import math
+import uuid
+import decimal
+import datetime
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+def default(v):
+    # Decimal is dumped as string (no precision loss), same as Fixed and Price fields
+    if isinstance(v, (datetime.datetime, datetime.date, datetime.time)):
+        return v.isoformat()
+    elif isinstance(v, (decimal.Decimal, uuid.UUID)):
+        return str(v)
+    raise TypeError("{!r} is not JSON serializable".format(v))
+
+
+def _finite(v):
+    # NaN and Infinity are dumped as null, same as orjson
+    if isinstance(v, float):
+        return v if math.isfinite(v) else None
+    elif isinstance(v, dict):
+        return {k: _finite(x) for k, x in v.items()}
+    elif isinstance(v, (list, tuple)):
+        return [_finite(x) for x in v]
+    return v
+
+
+def _stdlib_dumps(v):
+    return json.dumps(v, default=default, separators=(",", ":"), ensure_ascii=False, allow_nan=False)
+
+
+def stdlib_dumps(v):
+    try:
+        s = _stdlib_dumps(v)
+    except ValueError as e:
+        if not str(e).startswith("Out of range float"):  # e.g. circular reference
+            raise
+        s = _stdlib_dumps(_finite(v))
+    return s.encode("utf-8")
+
+
+def orjson_dumps(v):
+    try:
+        return orjson.dumps(v, default=default, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:  # e.g. int beyond 64 bits
+        return stdlib_dumps(v)
+
+
+dumps = stdlib_dumps if orjson is None else orjson_dumps
@@ -11,3 +11,7 @@ class LayoutTooFew(MarshmallowFormError):
 
 class LayoutTooMany(MarshmallowFormError):
     pass
+
+
+class InputTooLarge(MarshmallowFormError):
+    pass
@@ -0,0 +1,721 @@
+# -*- coding:utf-8 -*-
+import logging
+import copy
+import threading
+import weakref
+from functools import partial
+from collections import OrderedDict
+from marshmallow import fields, Schema
+from marshmallow.fields import Marshaller, Unmarshaller
+from marshmallow.exceptions import MarshallingError, UnmarshallingError
+from .langhelpers import reify, OrderedSet, LRUCache, WeakValueLRUCache, freeze
+from .layout import FlattenLayout
+from .limits import Limits
+from .plan import CleansingPlan
+from .registry import registry
+from .boundfield import (
+    MARKER,
+    bound_field,
+    Field,
+    FormState,
+    intern_metadata,
+)
+logger = logging.getLogger(__name__)
+
+
+class RegisterAction(object):
+    def __init__(self, action, method):
+        self.action = action
+        self.method = method
+
+    def register(self, schema):
+        self.action(schema, self.method)
+
+
+_schema_lock = threading.RLock()
+
+
+class FormSchema(Schema):
+    """schema without reference cycles. (fields refer to the schema weakly)"""
+
+    @property
+    def set_class(self):
+        return OrderedSet if self.ordered else set
+
+    def _update_fields(self, *args, **kwargs):
+        fields_dict = super(FormSchema, self)._update_fields(*args, **kwargs)
+        proxy = None
+        for f in fields_dict.values():
+            if f.parent is self:
+                f.parent = proxy = proxy or weakref.proxy(self)
+        return fields_dict
+
+    __batch_validators__ = None  # [(field name, func)] (see marshmallow_form.batch)
+    run_batch_validators = True  # False, if the caller (e.g. FormSet) runs them across forms
+
+    @classmethod
+    def batch_validator(cls, name, func):
+        cls.__batch_validators__ = list(cls.__batch_validators__ or ()) + [(name, func)]
+        return func
+
+    def _do_load(self, data, many=None, postprocess=True):
+        if not (self.__batch_validators__ and self.run_batch_validators):
+            return super(FormSchema, self)._do_load(data, many=many, postprocess=postprocess)
+        # same as Schema._do_load(), but batch validators run before make_object and the error handler
+        from . import batch
+        many = self.many if many is None else bool(many)
+        result = self._unmarshal(
+            data,
+            self.fields,
+            many=many,
+            strict=self.strict,
+            validators=[partial(func, self) for func in (self.__validators__ or ())],
+            preprocess=[partial(func, self) for func in (self.__preprocessors__ or ())],
+            postprocess=[],
+            dict_class=self.dict_class
+        )
+        errors = self._unmarshal.errors
+        batch_errors = batch.validate(self, (result or []) if many else [result])
+        if batch_errors:
+            if self.strict:
+                raise UnmarshallingError(batch_errors)
+            batch.merge(errors, batch_errors, many)
+        if postprocess:
+            if many and result is not None:
+                result = [self.make_object(row) for row in result]
+            else:
+                result = self.make_object(result)
+        if errors and callable(self.__error_handler__):
+            self.__error_handler__(errors, data)
+        return result, errors
+
+
+class FormMeta(type):
+    SchemaBase = FormSchema
+    registry = registry
+
+    @property
+    def Schema(cls):
+        """marshmallow Schema class, built (and handlers registered) on first access"""
+        schema = cls.__dict__.get("_schema_class")
+        if schema is None:
+            with _schema_lock:
+                schema = cls.__dict__.get("_schema_class")
+                if schema is None:
+                    schema = cls._build_schema()
+        return schema
+
+    @Schema.setter
+    def Schema(cls, schema):
+        cls._schema_class = schema
+
+    def _build_schema(cls):
+        name, schema_attrs, names = cls._schema_recipe
+        schema_bases = []
+        for b in cls.__bases__:
+            schema = getattr(b, "Schema", None)
+            if isinstance(schema, type) and issubclass(schema, Schema):
+                if schema not in schema_bases:
+                    schema_bases.append(schema)
+        if len(schema_bases) <= 0:
+            schema_bases.append(cls.SchemaBase)
+
+        # fields excluded by the base form (or by this form)
+        exclude = [k for b in schema_bases for k in getattr(b, "_declared_fields", ()) if k not in names]
+        if exclude:
+            schema_attrs["Meta"].exclude = tuple(exclude)
+
+        schema_class = cls.SchemaBase.__class__(name, tuple(schema_bases), schema_attrs)
+        for ac in cls.register_actions:
+            ac.register(schema_class)
+        cls._schema_class = schema_class
+        del cls._schema_recipe
+        return schema_class
+
+    def warmup(cls, cache=None):
+        """building Schema class, cleansing plan and layout plan eagerly.
+        if cache (PlanCache) is passed, the cleansing plan is loaded from it, and the Schema class is left lazy.
+        """
+        if cache is None:
+            cls.Schema
+        cls.cleansing_plan_for({}, cache=cache)
+        if hasattr(cls.layout, "warmup"):
+            cls.layout.warmup()
+        return cls
+
+    @staticmethod
+    def access(self, k, ob):
+        return getattr(ob, k)
+
+    @classmethod
+    def flatten_metadata(self, fields, overrides, prefix="", table=None):
+        """{<dotted name>: field's metadata merged with overrides}, computed once at class creation"""
+        if table is None:
+            table = {}
+        for name, f in fields:
+            if f is None:
+                continue
+            merged = dict(f.metadata)
+            override = overrides.get(name)
+            if hasattr(override, "items"):
+                merged.update(override)
+            path = prefix + name
+            table[path] = intern_metadata(merged)
+            nested = getattr(f, "nested", None)
+            if not getattr(f, "many", False) and hasattr(nested, "_declared_fields"):
+                self.flatten_metadata(nested._declared_fields.items(), merged, prefix=path + ".", table=table)
+        return table
+
+    @classmethod
+    def from_schema(self, name, schema, bases, attrs, meta=object()):
+        attrs["_schema_class"] = schema
+        metadata = attrs["metadata"] = {}
+
+        layout = None
+        layout = getattr(meta, "layout", None)
+        metadata.update(getattr(meta, "metadata", {}))
+        metadata.update(getattr(meta, "overrides", {}))
+        if hasattr(meta, "itemgetter"):
+            if isinstance(meta.itemgetter, staticmethod):
+                attrs["itemgetter"] = meta.itemgetter
+            else:
+                attrs["itemgetter"] = staticmethod(meta.itemgetter)
+        if hasattr(meta, "limits"):
+            attrs["_limits"] = Limits().merged(meta.limits)
+        if hasattr(meta, "json"):
+            attrs["_json_mode"] = meta.json
+
+        boundary_container = []
+        for k, f in schema._declared_fields.items():
+            attrs[k] = Field(f, name=k)
+            boundary_container.append(attrs[k])
+        for field_name in getattr(meta, "fields", []):
+            if field_name not in attrs:
+                attrs[field_name] = Field(None, name=field_name)
+                boundary_container.append(attrs[field_name])
+
+        attrs["ordered_names"] = [f.name for f in sorted(boundary_container, key=lambda f: f._c)]
+
+        cls = super(FormMeta, self).__new__(self, name, bases, attrs)
+        cls.metadata = metadata
+        cls.field_metadata = self.flatten_metadata(schema._declared_fields.items(), metadata)
+
+        if layout is not None:
+            layout.check_shape(cls())
+        cls.layout = layout or FlattenLayout()
+        return self.registry.add(cls)
+
+    def __new__(self, name, bases, attrs):
+        # todo: rewrite
+        # - collecting schema
+        # - make_object
+        # - layout
+
+        schema_attrs = {}
+        boundary_container = {}
+        register_actions = []
+        metadata = {}
+        limits = None
+
+        for b in bases:
+            if hasattr(b, "ordered_names"):
+                for k in b.ordered_names:
+                    v = getattr(b, k)
+                    schema_attrs[k] = v.expose()
+                    boundary_container[k] = v
+            if hasattr(b, "metadata"):
+                metadata.update(b.metadata)
+            if limits is None and hasattr(b, "_limits"):
+                limits = b._limits
+
+        for k, v in attrs.items():
+            if hasattr(v, "expose"):
+                v.name = k
+                schema_attrs[k] = v.expose()
+                boundary_container[k] = v
+            if hasattr(v, "register") and callable(v.register):
+                register_actions.append(v)
+
+        # this is meta of marshmallow Schema
+        class Meta:
+            ordered = True
+        schema_attrs["Meta"] = Meta
+
+        layout = None
+        if "Meta" in attrs:
+            meta = attrs["Meta"]
+            layout = getattr(meta, "layout", None)
+            metadata.update(getattr(meta, "metadata", {}))
+            metadata.update(getattr(meta, "overrides", {}))
+            if hasattr(meta, "itemgetter"):
+                if isinstance(meta.itemgetter, staticmethod):
+                    attrs["itemgetter"] = meta.itemgetter
+                else:
+                    attrs["itemgetter"] = staticmethod(meta.itemgetter)
+            if hasattr(meta, "limits"):
+                attrs["_limits"] = (limits or Limits()).merged(meta.limits)
+            if hasattr(meta, "json"):
+                attrs["_json_mode"] = meta.json
+            if hasattr(meta, "fields"):
+                for field_name in meta.fields:
+                    if field_name not in attrs:
+                        v = Field(None, name=field_name)
+                        attrs[field_name] = v
+                        boundary_container[field_name] = v
+                Meta.fields = attrs["Meta"].fields
+            for field_name in getattr(meta, "exclude", ()):
+                boundary_container.pop(field_name, None)
+                schema_attrs.pop(field_name, None)
+
+        if "make_object" in attrs:
+            schema_attrs["make_object"] = attrs.pop("make_object")
+
+        attrs["ordered_names"] = [f.name for f in sorted(boundary_container.values(), key=lambda f: f._c)]
+        attrs["register_actions"] = register_actions
+        # the Schema class is built lazily, on first access (see FormMeta.Schema)
+        attrs["_schema_recipe"] = (name.replace("Form", "Schema"), schema_attrs, frozenset(boundary_container))
+
+        cls = super(FormMeta, self).__new__(self, name, bases, attrs)
+        cls.metadata = metadata
+        cls.field_metadata = self.flatten_metadata(
+            ((f.name, f.field) for f in boundary_container.values()), metadata)
+
+        if layout is not None:
+            layout.check_shape(cls())
+        cls.layout = layout or FlattenLayout()
+        return self.registry.add(cls)
+
+
+_variant_cache = LRUCache(maxsize=128)
+
+
+def _field_fingerprint(f):
+    """type and arguments of a field. (the field itself, if not hashable)"""
+    field = getattr(f, "field", f)  # boundfield.Field wraps a marshmallow field
+    try:
+        return (field.__class__, freeze({k: v for k, v in vars(field).items()
+                                         if not k.startswith("_") and k != "parent"}))
+    except TypeError:
+        return field
+
+
+def _state_attribute(name):
+    def fget(self):
+        return getattr(self._form_state, name)
+
+    def fset(self, value):
+        setattr(self._form_state, name, value)
+    return property(fget, fset)
+
+
+class FormBase(object):
+    itemgetter = staticmethod(lambda d, k: d.get(k, ""))
+    _limits = Limits()  # Meta.limits, merged with limits argument of __init__
+    field_metadata = {}
+    _json_mode = False  # Meta.json. if true, load() expects nested dict (not flatten html form keys)
+    validation_cache = None  # ValidationCache, for duplicate submissions
+    # shared with bound fields, via FormState
+    data = _state_attribute("data")
+    rawdata = _state_attribute("rawdata")
+    errors = _state_attribute("errors")
+    initial = _state_attribute("initial")
+    _generation = _state_attribute("generation")  # incremented by touch(), when fields, data or errors are changed
+    error_handler = partial(RegisterAction, (lambda schema, method: schema.error_handler(method)))
+    data_handler = partial(RegisterAction, (lambda schema, method: schema.data_handler(method)))
+    validator = partial(RegisterAction, (lambda schema, method: schema.validator(method)))
+    preprocessor = partial(RegisterAction, (lambda schema, method: schema.preprocessor(method)))
+    accessor = partial(RegisterAction, (lambda schema, method: schema.accessor(method)))
+
+    @staticmethod
+    def batch_validator(name):
+        """like validator, but called once with the column of `name` across all rows
+        (of Nested(..., many=True) or FormSet). see marshmallow_form.batch
+        """
+        return partial(RegisterAction, (lambda schema, method: schema.batch_validator(name, method)))
+
+    def __init__(self, data=None, initial=None, prefix="", options={"strict": False}, metadata=None, limits=None):
+        self.options = options
+        self._form_state = FormState(itemgetter=self.itemgetter)
+        self.rawdata = data or {}
+        self.data = self.rawdata.copy()
+        self.initial = initial or {}
+        self.errors = None
+        self.prefix = prefix
+        self.metadata = copy.deepcopy(self.metadata)
+        if metadata:
+            self.metadata.update(metadata)
+            # precomputed metadata is not used for fields overridden by instance
+            self.field_metadata = {k: v for k, v in self.field_metadata.items()
+                                   if k.split(".", 1)[0] not in metadata}
+        if limits:
+            self._limits = self._limits.merged(limits)
+
+    @reify
+    def _update_fields_option(self):
+        return len(self.schema.fields) != len(self.schema.declared_fields)
+
+    @property
+    def Schema(self):
+        return self.__class__.Schema
+
+    @reify
+    def schema(self):
+        return self.__class__.Schema(**self.options)
+
+    @classmethod
+    def variant(cls, name, add=None, remove=(), cache=_variant_cache):
+        """derived form class, with added (form or marshmallow) fields and removed fields.
+        cached by name, the field names and the fingerprints of the added fields (type and arguments)
+        """
+        add = OrderedDict(add or ())
+        key = (cls, name, tuple((k, _field_fingerprint(f)) for k, f in add.items()), tuple(remove))
+        variant = cache.get(key)
+        if variant is None:
+            class Meta:
+                exclude = tuple(remove)
+            attrs = {k: (f if hasattr(f, "expose") else Field(f)) for k, f in add.items()}  # like add_field()
+            attrs["Meta"] = Meta
+            variant = cache[key] = cls.__class__("{}_{}".format(cls.__name__, name), (cls, ), attrs)
+        return variant
+
+    @classmethod
+    def from_object(cls, ob, *args, **kwargs):
+        form = cls(*args, **kwargs)
+        data = form.serialize(ob)
+        form.rawdata = data
+        form.data = data.copy()
+        form.touch()
+        return form
+
+    @classmethod
+    def from_objects(cls, obs, loaders=None, *args, **kwargs):
+        """from_object() for many objects.
+        loaders ({<dotted field name>: loader(objects) -> values}) fetch an attribute of all objects at once.
+        (e.g. avoiding N+1 queries of ORM relations)
+        """
+        from . import prefetch
+        obs = list(obs)
+        forms = [cls(*args, **kwargs) for _ in obs]
+        if not forms:
+            return forms
+        form = forms[0]
+        schema = cls.Schema(**form.options)  # not shared with forms. (holding prefetched values)
+        if loaders:
+            prefetch.prefetch(schema, obs, loaders)
+        update_fields = form._update_fields_option
+        for form, ob in zip(forms, obs):
+            result = schema.dump(ob, update_fields=update_fields)
+            if result.errors:
+                raise MarshallingError(result.errors)
+            form.rawdata = result.data
+            form.data = result.data.copy()
+            form.touch()
+        return forms
+
+    def touch(self):
+        self._generation += 1
+
+    def _init_delta(self):
+        # add_field()/remove_field() are recorded as a delta on top of the class definition
+        if "_names" not in self.__dict__:
+            self._names = OrderedDict.fromkeys(self.ordered_names)
+            self._added = OrderedDict()
+            self._removed = set()
+            self.ordered_names = self._names.keys()
+
+    def _changed_fields(self):
+        self.__dict__.pop("_delta_schema", None)
+        self.__dict__.pop("cleansing_plan", None)
+        self.touch()
+
+    @property
+    def current_schema(self):
+        """schema with added/removed fields. the base schema is not modified"""
+        if "_names" not in self.__dict__:
+            return self.schema
+        schema = self.__dict__.get("_delta_schema")
+        if schema is None:
+            base = self.schema
+            removed = self._removed
+            fields_dict = base.dict_class((k, f) for k, f in base.fields.items() if k not in removed)
+            fields_dict.update(self._added)
+            schema = copy.copy(base)  # shallow. fields are shared with base
+            schema.fields = fields_dict
+            schema._marshal = Marshaller(prefix=base.prefix)
+            schema._unmarshal = Unmarshaller()
+            self._delta_schema = schema
+        return schema
+
+    def add_field(self, name, field):
+        if hasattr(field, "expose"):
+            field = field.expose()
+        self._init_delta()
+        self._removed.discard(name)
+        self._added[name] = field
+        self._names[name] = None
+        setattr(self, name, bound_field(name, field, self._form_state, overrides=self.metadata.get(name)))
+        self._changed_fields()
+
+    def remove_field(self, name):
+        self._init_delta()
+        if name not in self._names:
+            raise ValueError(name)
+        del self._names[name]
+        if self._added.pop(name, None) is None:
+            self._removed.add(name)
+        self.__dict__.pop(name, None)
+        self._changed_fields()
+
+    def __iter__(self):
+        cached = self.__dict__.get("_iterated")
+        if cached is None or cached[0] != self._generation:
+            cached = self._iterated = (self._generation, list(self.layout(self)))
+        return iter(cached[1])
+
+    @reify
+    def cleansing_plan(self):
+        if "_names" in self.__dict__:  # modified by add_field() or remove_field()
+            return CleansingPlan.compile(self.current_schema.fields)
+        return self.cleansing_plan_for(self.options, self.__dict__.get("schema"))
+
+    @classmethod
+    def cleansing_plan_for(cls, options, schema=None, cache=None):
+        """compiled once per class and only/exclude options"""
+        if "_plans" not in cls.__dict__:
+            cls._plans = {}
+        key = (tuple(options.get("only") or ()), tuple(options.get("exclude") or ()))
+        plan = cls._plans.get(key)
+        if plan is None:
+            if cache is not None:
+                plan = cache.get(cls, key)
+            if plan is None:
+                schema = schema or cls.Schema(**options)
+                plan = CleansingPlan.compile(schema.fields)
+                if cache is not None:
+                    cache.put(cls, key, plan)
+            cls._plans[key] = plan
+        return plan
+
+    def cleansing(self, data=None):
+        data = data or self.rawdata
+        limits = self._limits
+        return self.cleansing_plan(data, prefix=self.prefix, max_index=limits.max_index,
+                                   max_list_length=limits.max_list_length)
+
+    def cleansing_json(self, data=None):
+        data = data or self.rawdata
+        return self._cleansing_json(data, self.current_schema.fields)
+
+    def _cleansing_json(self, data, fields_dict):
+        # same semantics as cleansing(), but for nested input.
+        # data is copied only if something is dropped or filled.
+        result = data
+        for name, f in fields_dict.items():
+            v = data.get(name, "")
+            if hasattr(f, "nested") and f.many:
+                if not isinstance(v, (list, tuple)):
+                    continue
+                new_v = v
+                subfields = f.schema.fields
+                for i, row in enumerate(v):
+                    if hasattr(row, "get"):
+                        new_row = self._cleansing_json(row, subfields)
+                        if new_row is not row:
+                            if new_v is v:
+                                new_v = list(v)
+                            new_v[i] = new_row
+            elif hasattr(f, "nested"):
+                if hasattr(v, "get"):
+                    new_v = self._cleansing_json(v, f.schema.fields)
+                elif v == "":
+                    new_v = self._cleansing_json({}, f.schema.fields) or MARKER
+                else:
+                    continue
+            elif v == "":
+                if f.required or not isinstance(f, fields.String):
+                    new_v = MARKER
+                else:
+                    new_v = v
+            else:
+                continue
+
+            if new_v is MARKER:
+                if name in data:
+                    if result is data:
+                        result = data.copy()
+                    del result[name]
+            elif new_v is not v or name not in data:
+                if result is data:
+                    result = data.copy()
+                result[name] = new_v
+        return result
+
+    def has_errors(self):
+        return bool(self.errors)
+
+    def validate(self, data=None, cleansing=True, json=None):
+        self.deserialize(data=data, cleansing=True, json=json)
+        return not self.has_errors()
+
+    def load(self, data=None, cleansing=True, json=None):
+        from . import validationcontext
+        data = data or self.rawdata
+        self._limits.check(data)
+        if cleansing:
+            if self._json_mode if json is None else json:
+                data = self.cleansing_json(data)
+            else:
+                data = self.cleansing(data)
+            self.rawdata = data  # xxx
+            self.touch()
+        with validationcontext.activate():  # see validationcontext.with_context()
+            if self.validation_cache is not None:
+                return self.validation_cache.load(self, self.current_schema, data)
+            return self.current_schema.load(data)
+
+    def deserialize(self, data=None, cleansing=True, json=None):
+        result = self.load(data=data, cleansing=cleansing, json=json)
+        self.errors = result.errors
+        self.data = result.data
+        self.touch()
+        return result.data
+
+    def dump(self, data=None):
+        data = data or self.data
+        if "_names" in self.__dict__:
+            result = self.current_schema.dump(data, update_fields=False)
+        else:
+            result = self.schema.dump(data, update_fields=self._update_fields_option)
+        return result
+
+    def serialize(self, data=None):
+        result = self.dump(data=data)
+        if result.errors:
+            raise MarshallingError(result.errors)
+        return result.data
+
+    def serialize_json(self, ob, dumps=None):
+        """serialize() and encoding to JSON bytes (see marshmallow_form.encoding).
+        the dumped dict is passed to the encoder as is. (marshmallow has no hook for encoding while dumping,
+        and one call of the C encoder on the whole dict is faster than encoding field by field)
+        """
+        from . import encoding
+        return (dumps or encoding.dumps)(self.serialize(ob))
+
+    def _schema_for(self, ob):
+        """current_schema, with the fields updated for ob (as dump() does), for dumping field by field"""
+        schema = self.current_schema
+        if "_names" not in self.__dict__ and self._update_fields_option:
+            schema._update_fields(ob)
+        return schema
+
+    def serialize_items(self, ob):
+        """streaming version of serialize(). yielding (key, value) field by field.
+        for Nested(many=True) fields, the value is an iterable of per-element dicts.
+        """
+        from . import stream
+        return stream.iterate_items(self._schema_for(ob), ob)
+
+    def serialize_chunks(self, ob, dumps=None):
+        """streaming version of json.dumps(serialize(ob)). yielding JSON text chunks"""
+        from . import stream
+        return stream.iterate_json(self.serialize_items(ob), dumps=dumps)
+
+    def dump_changes(self, ob, since=None):
+        """serialize() of only changed fields (see marshmallow_form.changes). returning (patch, snapshot).
+        the snapshot is passed as `since` on next call.
+        """
+        from . import changes
+        return changes.dump_changes(self._schema_for(ob), ob, since=since)
+
+    def __getitem__(self, k):
+        return self.itemgetter(self.metadata, k)
+
+Form = FormMeta("Form", (FormBase, ), {})
+
+
+# factories
+def form_factory(name, schema, base=FormBase, metaclass=FormMeta, attrs=None, meta=object()):
+    return metaclass.from_schema(name, schema, (base, ), attrs or {}, meta=meta)
+
+
+_factory_cache = WeakValueLRUCache(maxsize=256)
+
+
+def _meta_fingerprint(meta):
+    if meta is None:
+        return None
+    if isinstance(meta, type):
+        return freeze({k: v for k, v in vars(meta).items() if not k.startswith("__")})
+    return meta
+
+
+def cached_form_factory(name, schema, base=FormBase, metaclass=FormMeta, attrs=None, meta=None, cache=_factory_cache):
+    """same as form_factory, but returning the same class for the same arguments"""
+    try:
+        key = (name, schema, base, metaclass, freeze(attrs or {}), _meta_fingerprint(meta))
+    except TypeError:  # unhashable
+        key = None
+    if key is not None:
+        cls = cache.get(key)
+        if cls is not None:
+            return cls
+    attrs = dict(attrs or {})  # from_schema() adds the fields to attrs, after the key is computed
+    if meta is None:
+        cls = form_factory(name, schema, base=base, metaclass=metaclass, attrs=attrs)
+    else:
+        cls = form_factory(name, schema, base=base, metaclass=metaclass, attrs=attrs, meta=meta)
+    if key is not None:
+        cache[key] = cls
+    return cls
+
+
+class ModelForm(Form):
+    """form for editing a model. changes are tracked against initial (or the model itself)"""
+
+    def __init__(self, *args, **kwargs):
+        self.model = kwargs.pop("model", None)
+        super(ModelForm, self).__init__(*args, **kwargs)
+
+    @property
+    def changed_fields(self):
+        """dotted paths of deserialized data, different from initial (or the model's attributes)"""
+        from . import tracking
+        base = self.initial or self.model
+        return tracking.changed_paths(self.current_schema, self.data, {} if base is None else base)
+
+    def apply_to(self, model=None, factories=None):
+        """writing back only changed attributes to the model. returning (applied paths, unapplied paths).
+
+        deserialized dicts are not set to attributes of objects (e.g. relations of ORM models) as is.
+        factories ({<field path without row indexes>: callable(dict) -> object}) make objects of them.
+        without a factory, the path is unapplied. (so is a path whose parent is missing or None in the model)
+        """
+        from . import tracking
+        model = self.model if model is None else model
+        factories = factories or {}
+        schema = self.current_schema
+        data = self.data
+        applied = set()
+        unapplied = set()
+        for path in sorted(self.changed_fields):
+            value = tracking.get_path(data, path)
+            field = tracking.field_for_path(schema, path)
+            parent, _, last = path.rpartition(".")
+            container = tracking.get_path(model, parent) if parent else model
+            if container is tracking.MARKER or container is None:  # e.g. changed against initial, not the model
+                unapplied.add(path)
+                continue
+            if field is not None and tracking.is_relation(field) and not isinstance(container, dict) \
+               and value is not None:
+                factory = factories.get(".".join(k for k in path.split(".") if not k.isdigit()))
+                if factory is None:
+                    unapplied.add(path)
+                    continue
+                if field.many and not last.isdigit():
+                    value = [factory(row) for row in value]
+                else:
+                    value = factory(value)
+            tracking.set_item(container, last, value)
+            applied.add(path)
+        return applied, unapplied
@@ -0,0 +1,88 @@
+# -*- coding:utf-8 -*-
+from collections import OrderedDict
+from . import batch, validationcontext
+
+
+class FormSet(object):
+    """a set of same forms, distinguished by prefix ("row0-", "form-1-", ...)
+
+    data is partitioned by prefix in a single pass (each key goes to the longest matching prefix),
+    and each form gets only its own slice.
+    the schema (and the cleansing plan) is shared by all forms.
+    """
+
+    def __init__(self, formclass, prefixes, data=None, initial=None, options={"strict": False}):
+        self.formclass = formclass
+        self.rawdata = data or {}
+        self.initial = initial or {}
+        self.errors = None
+        prefixes = list(prefixes)
+
+        schema = self.schema = formclass.Schema(**options)
+        schema.run_batch_validators = False  # run across forms, in deserialize()
+        slices = self.partition(self.rawdata, prefixes)
+        self.forms = OrderedDict()
+        for p in prefixes:
+            form = formclass(slices[p], initial=self.initial.get(p), prefix=p, options=options)
+            form.schema = schema
+            self.forms[p] = form
+
+    def partition(self, data, prefixes):
+        slices = OrderedDict((p, {}) for p in prefixes)
+        sizes = sorted(set(len(p) for p in prefixes), reverse=True)
+        for k, v in data.items():
+            for n in sizes:
+                d = slices.get(k[:n])
+                if d is not None:
+                    d[k] = v
+                    break
+        return slices
+
+    @property
+    def prefixes(self):
+        return list(self.forms.keys())
+
+    def __iter__(self):
+        return iter(self.forms.values())
+
+    def __len__(self):
+        return len(self.forms)
+
+    def __getitem__(self, prefix):
+        return self.forms[prefix]
+
+    def has_errors(self):
+        return bool(self.errors)
+
+    def validate(self, cleansing=True):
+        self.deserialize(cleansing=cleansing)
+        return not self.has_errors()
+
+    def deserialize(self, cleansing=True):
+        result = []
+        errors = OrderedDict()
+        for p, form in self.forms.items():
+            result.append(form.deserialize(cleansing=cleansing))
+            if form.has_errors():
+                errors[p] = form.errors
+        if self.schema.__batch_validators__:
+            self.validate_batch(errors)
+        self.errors = errors
+        return result
+
+    def validate_batch(self, errors):
+        forms = list(self.forms.items())
+        with validationcontext.activate():
+            batch_errors = batch.validate(self.schema, [form.data for _, form in forms])
+        handler = self.schema.__error_handler__
+        for i, row_errors in batch_errors.items():
+            p, form = forms[i]
+            had_errors = bool(form.errors)
+            form_errors = form.errors = form.errors or {}
+            for key, messages in row_errors.items():
+                form_errors.setdefault(key, []).extend(messages)
+            form.touch()
+            errors[p] = form_errors
+            if not had_errors and callable(handler):  # (otherwise, already called in form's load())
+                handler(form_errors, form.rawdata)
+        return errors
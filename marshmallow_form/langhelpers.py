@@ -1,3 +1,8 @@
+import weakref
+from collections import OrderedDict
+from collections.abc import MutableMapping, MutableSet
+
+
 class reify(object):
     def __init__(self, wrapped):
         self.wrapped = wrapped
@@ -14,6 +19,121 @@ class reify(object):
         return val
 
 
+class generational_reify(object):
+    """like reify, but recomputed after ``inst.generation`` is changed"""
+    def __init__(self, wrapped):
+        self.wrapped = wrapped
+        self.name = wrapped.__name__
+        try:
+            self.__doc__ = wrapped.__doc__
+        except:  # pragma: no cover
+            pass
+
+    def __get__(self, inst, objtype=None):
+        if inst is None:
+            return self
+        generation = inst.generation
+        cached = inst.__dict__.get(self.name)
+        if cached is not None and cached[0] == generation:
+            return cached[1]
+        val = self.wrapped(inst)
+        inst.__dict__[self.name] = (generation, val)
+        return val
+
+    def __set__(self, inst, val):
+        inst.__dict__[self.name] = (inst.generation, val)
+
+
+class slot_reify(object):
+    """reify for classes having __slots__. the value is cached in the slot
+
+    @slot_reify("_metadata")
+    def metadata(self):
+        ...
+    """
+    def __init__(self, slot):
+        self.slot = slot
+        self.member = None
+
+    def __call__(self, wrapped):
+        self.wrapped = wrapped
+        try:
+            self.__doc__ = wrapped.__doc__
+        except:  # pragma: no cover
+            pass
+        return self
+
+    def _member(self, objtype):
+        for cls in objtype.__mro__:
+            if self.slot in cls.__dict__:
+                self.member = cls.__dict__[self.slot]
+                return self.member
+        raise TypeError("{} does not have slot {!r}".format(objtype.__name__, self.slot))
+
+    def __get__(self, inst, objtype=None):
+        if inst is None:
+            return self
+        member = self.member or self._member(inst.__class__)
+        try:
+            return member.__get__(inst, objtype)
+        except AttributeError:  # empty slot
+            val = self.wrapped(inst)
+            member.__set__(inst, val)
+            return val
+
+    def __set__(self, inst, val):
+        (self.member or self._member(inst.__class__)).__set__(inst, val)
+
+
+class slot_generational_reify(slot_reify):
+    """generational_reify for classes having __slots__. the generation is read from ``inst.<generation>``"""
+    def __init__(self, slot, generation="generation"):
+        super(slot_generational_reify, self).__init__(slot)
+        self.generation = generation
+
+    def __get__(self, inst, objtype=None):
+        if inst is None:
+            return self
+        member = self.member or self._member(inst.__class__)
+        generation = getattr(inst, self.generation)
+        try:
+            cached = member.__get__(inst, objtype)
+            if cached[0] == generation:
+                return cached[1]
+        except AttributeError:  # empty slot
+            pass
+        val = self.wrapped(inst)
+        member.__set__(inst, (generation, val))
+        return val
+
+    def __set__(self, inst, val):
+        (self.member or self._member(inst.__class__)).__set__(inst, (getattr(inst, self.generation), val))
+
+
+class OrderedSet(MutableSet):
+    """insertion ordered set, backed by OrderedDict (no linked list of lists, so no reference cycles)"""
+    def __init__(self, iterable=()):
+        self.d = OrderedDict.fromkeys(iterable)
+
+    def __contains__(self, k):
+        return k in self.d
+
+    def __iter__(self):
+        return iter(self.d)
+
+    def __len__(self):
+        return len(self.d)
+
+    def add(self, k):
+        self.d[k] = None
+
+    def discard(self, k):
+        self.d.pop(k, None)
+
+    def __repr__(self):
+        return "{}({!r})".format(self.__class__.__name__, list(self.d))
+
+
 class Counter(object):
     def __init__(self, i):
         self.i = i
@@ -22,3 +142,173 @@ class Counter(object):
         v = self.i
         self.i += 1
         return v
+
+
+class FrozenDict(dict):
+    """read only dict"""
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("{} is read only".format(self.__class__.__name__))
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _readonly
+
+    def __repr__(self):
+        return "{}({})".format(self.__class__.__name__, dict.__repr__(self))
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self), ))
+
+
+class InternTable(object):
+    """hash-consing of dicts. equal dicts (whose values are all hashable) share one FrozenDict"""
+    def __init__(self):
+        self.table = weakref.WeakValueDictionary()
+
+    def __call__(self, d):
+        try:
+            key = frozenset((k, v.__class__, v) for k, v in d.items())  # 1 and True are different
+            hash(key)
+        except TypeError:  # e.g. list value. frozen but not shared
+            return d if isinstance(d, FrozenDict) else FrozenDict(d)
+        v = self.table.get(key)
+        if v is None:
+            v = self.table[key] = d if isinstance(d, FrozenDict) else FrozenDict(d)
+        return v
+
+    def __len__(self):
+        return len(self.table)
+
+
+_deleted = object()
+
+
+class Overlay(MutableMapping):
+    """copy on write view. writes go to a local dict, created at first write"""
+    def __init__(self, base):
+        self.base = base
+        self.local = None
+
+    def __getitem__(self, k):
+        local = self.local
+        if local is not None and k in local:
+            v = local[k]
+            if v is _deleted:
+                raise KeyError(k)
+            return v
+        return self.base[k]
+
+    def get(self, k, default=None):
+        local = self.local
+        if local is not None and k in local:
+            v = local[k]
+            return default if v is _deleted else v
+        return self.base.get(k, default)
+
+    def __contains__(self, k):
+        local = self.local
+        if local is not None and k in local:
+            return local[k] is not _deleted
+        return k in self.base
+
+    def __setitem__(self, k, v):
+        if self.local is None:
+            self.local = {}
+        self.local[k] = v
+
+    def __delitem__(self, k):
+        if k not in self:
+            raise KeyError(k)
+        self[k] = _deleted
+
+    def __iter__(self):
+        local = self.local
+        if local is None:
+            for k in self.base:
+                yield k
+            return
+        for k in self.base:
+            if k not in local:
+                yield k
+        for k, v in local.items():
+            if v is not _deleted:
+                yield k
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return "<Overlay {!r}>".format(dict(self))
+
+
+def freeze(v):
+    """hashable version of v (dict, list, set are converted). raising TypeError if impossible"""
+    if hasattr(v, "items"):
+        return frozenset((k, freeze(x)) for k, x in v.items())
+    elif isinstance(v, (list, tuple)):
+        return tuple(freeze(x) for x in v)
+    elif isinstance(v, (set, frozenset)):
+        return frozenset(freeze(x) for x in v)
+    hash(v)
+    return v
+
+
+class LRUCache(object):
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, k):
+        return k in self.data
+
+    def get(self, k, default=None):
+        data = self.data
+        if k not in data:
+            return default
+        data.move_to_end(k)
+        return data[k]
+
+    def __setitem__(self, k, v):
+        data = self.data
+        data[k] = v
+        data.move_to_end(k)
+        while len(data) > self.maxsize:
+            data.popitem(last=False)
+
+    def pop(self, k, default=None):
+        return self.data.pop(k, default)
+
+    def clear(self):
+        self.data.clear()
+
+
+class WeakValueLRUCache(object):
+    """weak value cache. recently used values (at most maxsize) are kept alive"""
+    def __init__(self, maxsize=128):
+        self.values = weakref.WeakValueDictionary()
+        self.recent = LRUCache(maxsize)
+
+    def __len__(self):
+        return len(self.values)
+
+    def get(self, k, default=None):
+        v = self.values.get(k)
+        if v is None:
+            return default
+        self.recent[k] = v
+        return v
+
+    def __setitem__(self, k, v):
+        self.values[k] = v
+        self.recent[k] = v
+
+    def clear(self):
+        self.values.clear()
+        self.recent.clear()
@@ -4,9 +4,27 @@ from .exceptions import (
 )
 
 
+class FieldPath(tuple):
+    """pre-split dotted name in shape ("ctime.year" -> ("ctime", "year"))"""
+
+
 class Layout(object):
     def __init__(self, shape):
         self.shape = shape
+        self.compiled = None
+
+    def compile(self, shape):
+        if isinstance(shape, (list, tuple)):
+            return [self.compile(row) for row in shape]
+        elif isinstance(shape, LColumn):
+            return (shape, [self.compile(row) for row in shape])
+        else:
+            return FieldPath(shape.split("."))
+
+    def warmup(self):
+        if self.compiled is None:
+            self.compiled = self.compile(self.shape)
+        return self.compiled
 
     def set_from_shape(self, shape, s):
         if isinstance(shape, (tuple, list, LColumn)):
@@ -27,22 +45,28 @@ class Layout(object):
             raise LayoutTooMany(diff)
 
     def build_iterator(self, form, shape):
-        if isinstance(shape, (list, tuple)):
-            return [self.build_iterator(form, row) for row in shape]
-        elif isinstance(shape, LColumn):
-            fields = [self.build_iterator(form, row) for row in shape]
-            return (shape, fields)
-        else:
+        compiled = self.warmup() if shape is self.shape else self.compile(shape)
+        return self.build_compiled(form, compiled)
+
+    def build_compiled(self, form, compiled):
+        if isinstance(compiled, FieldPath):
             target = form
-            for k in shape.split("."):
+            for k in compiled:
                 target = getattr(target, k)
             return target
+        elif isinstance(compiled, list):
+            return [self.build_compiled(form, row) for row in compiled]
+        else:
+            shape, rows = compiled
+            return (shape, [self.build_compiled(form, row) for row in rows])
 
     def __call__(self, form):
-        return iter(self.build_iterator(form, self.shape))
+        return iter(self.build_compiled(form, self.compiled or self.warmup()))
 
 
 class LColumn(object):
+    __slots__ = ("fields", "metadata")
+
     def __init__(self, *fields, **metadata):
         self.fields = fields
         self.metadata = metadata
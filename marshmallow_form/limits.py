@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+from marshmallow.compat import basestring
+from .exceptions import InputTooLarge
+
+
+class Limits(object):
+    """upper bounds for incoming data. None means unlimited"""
+    names = ("max_keys", "max_value_length", "max_list_length", "max_depth", "max_index")
+
+    def __init__(self, max_keys=None, max_value_length=None, max_list_length=None, max_depth=None,
+                 max_index=1000):
+        self.max_keys = max_keys
+        self.max_value_length = max_value_length
+        self.max_list_length = max_list_length
+        self.max_depth = max_depth
+        self.max_index = max_index  # for indexed keys ("texts.0.body"), checked while cleansing
+
+    def __repr__(self):
+        return "<Limits {}>".format(", ".join("{}={!r}".format(k, getattr(self, k)) for k in self.names))
+
+    def as_dict(self):
+        return {k: getattr(self, k) for k in self.names}
+
+    def merged(self, limits):
+        if not limits:
+            return self
+        d = self.as_dict()
+        for k, v in dict(limits).items():
+            if k not in d:
+                raise TypeError("unknown limit: {}".format(k))
+            d[k] = v
+        return self.__class__(**d)
+
+    @property
+    def unlimited(self):
+        return (self.max_keys is None and self.max_value_length is None
+                and self.max_list_length is None and self.max_depth is None)
+
+    def check(self, data):
+        """single pass over data (and its nested dicts/lists). raising InputTooLarge"""
+        if self.unlimited or not data:
+            return data
+        max_keys = self.max_keys
+        max_value_length = self.max_value_length
+        max_list_length = self.max_list_length
+        max_depth = self.max_depth
+
+        nkeys = 0
+        stack = [(data, 1)]
+        while stack:
+            d, depth = stack.pop()
+            if max_depth is not None and depth > max_depth:
+                raise InputTooLarge("max_depth", max_depth)
+            if hasattr(d, "items"):
+                nkeys += len(d)
+                if max_keys is not None and nkeys > max_keys:
+                    raise InputTooLarge("max_keys", max_keys)
+                values = d.values()
+                if max_depth is not None:
+                    # dotted keys ("ctime.year") are nested, too
+                    for k in d:
+                        if isinstance(k, basestring) and depth + k.count(".") > max_depth:
+                            raise InputTooLarge("max_depth", max_depth)
+            else:
+                if max_list_length is not None and len(d) > max_list_length:
+                    raise InputTooLarge("max_list_length", max_list_length)
+                values = d
+            for v in values:
+                if isinstance(v, basestring):
+                    if max_value_length is not None and len(v) > max_value_length:
+                        raise InputTooLarge("max_value_length", max_value_length)
+                elif isinstance(v, (list, tuple)) or hasattr(v, "items"):
+                    stack.append((v, depth + 1))
+        return data
@@ -0,0 +1,99 @@
+# -*- coding:utf-8 -*-
+from marshmallow import fields
+from .exceptions import InputTooLarge
+
+
+def set_path(d, path, v):
+    for t in path[:-1]:
+        if t not in d:
+            d[t] = {}
+        d = d[t]
+    d[path[-1]] = v
+
+
+class CleansingPlan(object):
+    """flatten html form keys -> nested dict, precompiled from schema fields"""
+
+    def __init__(self, leaves, lists):
+        self.leaves = leaves  # [(key, path, drop_empty)]
+        self.lists = lists  # {key: (path, plan)}, for Nested(..., many=True)
+
+    @classmethod
+    def compile(cls, fields_dict):
+        leaves = []
+        lists = {}
+        for name, f in fields_dict.items():
+            cls._collect(name, f, leaves, lists)
+        return cls(leaves, lists)
+
+    @classmethod
+    def _collect(cls, name, field, leaves, lists):
+        if hasattr(field, "nested"):
+            if field.many:
+                lists[name] = (tuple(name.split(".")), cls.compile(field.schema.fields))
+            else:
+                for subname, f in field.schema.fields.items():
+                    cls._collect("{}.{}".format(name, subname), f, leaves, lists)
+        else:
+            drop_empty = field.required or not isinstance(field, fields.String)
+            leaves.append((name, tuple(name.split(".")), drop_empty))
+
+    def as_data(self):
+        """plain tuples/dicts (for marshal)"""
+        return (self.leaves, {k: (path, plan.as_data()) for k, (path, plan) in self.lists.items()})
+
+    @classmethod
+    def from_data(cls, data):
+        """inverse of as_data(). raising ValueError if data is broken"""
+        try:
+            leaves, lists = data
+            leaves = [(k, tuple(path), bool(drop_empty)) for k, path, drop_empty in leaves]
+            lists = {k: (tuple(path), cls.from_data(subdata)) for k, (path, subdata) in lists.items()}
+        except (TypeError, ValueError, AttributeError) as e:
+            raise ValueError("broken plan: {}".format(e))
+        for k, path, _ in leaves:
+            if not isinstance(k, str) or tuple(k.split(".")) != path:
+                raise ValueError("broken plan: {!r}".format(k))
+        return cls(leaves, lists)
+
+    def __call__(self, data, prefix="", max_index=None, max_list_length=None):
+        result = {}
+        for k, path, drop_empty in self.leaves:
+            v = data.get(prefix + k, "")
+            if v == "" and drop_empty:
+                continue
+            set_path(result, path, v)
+        if self.lists:
+            for k, rows in self.collect_rows(data, prefix, max_index).items():
+                if max_list_length is not None and len(rows) > max_list_length:
+                    raise InputTooLarge("max_list_length", max_list_length)
+                path, plan = self.lists[k]
+                set_path(result, path, [plan(row, max_index=max_index, max_list_length=max_list_length)
+                                        for _, row in sorted(rows.items())])
+        return result
+
+    def collect_rows(self, data, prefix="", max_index=None):
+        """grouping indexed keys ("texts.0.body") by list and index, in one pass"""
+        lists = self.lists
+        grouped = {}
+        n = len(prefix)
+        for key, v in data.items():
+            if not key.startswith(prefix) or "." not in key:
+                continue
+            parts = key[n:].split(".")
+            for j in range(1, len(parts) - 1):
+                if parts[j].isdecimal():
+                    k = ".".join(parts[:j])
+                    if k in lists:
+                        i = int(parts[j])
+                        if max_index is not None and i > max_index:
+                            raise InputTooLarge("max_index", max_index)
+                        rows = grouped.get(k)
+                        if rows is None:
+                            rows = grouped[k] = {}
+                        row = rows.get(i)
+                        if row is None:
+                            row = rows[i] = {}
+                        row[".".join(parts[j + 1:])] = v
+                    break
+        return grouped
@@ -0,0 +1,99 @@
+# -*- coding:utf-8 -*-
+import os
+import marshal
+import hashlib
+import logging
+import tempfile
+import marshmallow
+from .plan import CleansingPlan
+logger = logging.getLogger(__name__)
+
+FORMAT = 1
+
+
+def describe_fields(fields):
+    """what a compiled plan depends on, as plain tuples"""
+    result = []
+    for name, f in fields:
+        if f is None:
+            result.append((name, None))
+            continue
+        fieldclass = f.__class__
+        nested = getattr(f, "nested", None)
+        if hasattr(nested, "_declared_fields"):
+            nested = describe_fields(nested._declared_fields.items())
+        result.append((
+            name, fieldclass.__module__, fieldclass.__name__,
+            bool(f.required), bool(getattr(f, "many", False)),
+            getattr(f, "only", None), getattr(f, "exclude", None), nested
+        ))
+    return tuple(result)
+
+
+def fingerprint(formclass):
+    fields = [(name, getattr(formclass, name).field) for name in formclass.ordered_names]
+    return hashlib.sha1(repr(describe_fields(fields)).encode("utf-8")).hexdigest()
+
+
+class PlanCache(object):
+    """on-disk cache of compiled cleansing plans, keyed by a fingerprint of the form definition.
+
+    plans are stored with marshal, and validated on load (broken entries are just ignored).
+    """
+
+    def __init__(self, path, salt=""):
+        self.path = path
+        self.header = ("marshmallow_form.plans", FORMAT, marshmallow.__version__, salt)
+        self.entries = {}
+        self.fingerprints = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        try:
+            with open(self.path, "rb") as rf:
+                header, entries = marshal.load(rf)
+        except (IOError, OSError, EOFError, ValueError, TypeError):
+            return self
+        if header != self.header or not isinstance(entries, dict):
+            logger.info("plan cache is outdated: %s", self.path)
+            return self
+        self.entries = entries
+        return self
+
+    def save(self):
+        if not self.dirty:
+            return False
+        dirname = os.path.dirname(os.path.abspath(self.path))
+        fd, tmppath = tempfile.mkstemp(dir=dirname)
+        try:
+            with os.fdopen(fd, "wb") as wf:
+                marshal.dump((self.header, self.entries), wf)
+            os.replace(tmppath, self.path)
+        except Exception:
+            os.unlink(tmppath)
+            raise
+        self.dirty = False
+        return True
+
+    def key(self, formclass, options_key):
+        fp = self.fingerprints.get(formclass)
+        if fp is None:
+            fp = self.fingerprints[formclass] = fingerprint(formclass)
+        return "{}:{!r}".format(fp, options_key)
+
+    def get(self, formclass, options_key):
+        key = self.key(formclass, options_key)
+        data = self.entries.get(key)
+        if data is None:
+            return None
+        try:
+            return CleansingPlan.from_data(data)
+        except ValueError:
+            logger.info("broken plan is found in cache: %s", key)
+            del self.entries[key]
+            return None
+
+    def put(self, formclass, options_key, plan):
+        self.entries[self.key(formclass, options_key)] = plan.as_data()
+        self.dirty = True
@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+from marshmallow import utils
+
+
+class BatchAccessor(object):
+    """accessor of schema, returning prefetched values (or falling back to the original accessor)"""
+
+    def __init__(self, values, fallback):
+        # {(id(ob), key): (ob, value)}, shared by the schemas of one prefetch.
+        # ob is kept alive (and checked by identity), so that its id is not reused by another object
+        self.values = values
+        self.fallback = fallback
+
+    def __call__(self, key, ob):
+        entry = self.values.get((id(ob), key))
+        if entry is None or entry[0] is not ob:
+            return self.fallback(key, ob)
+        return entry[1]
+
+
+def install(schema, values):
+    accessor = schema.__accessor__
+    if isinstance(accessor, BatchAccessor):
+        return accessor
+    accessor = BatchAccessor(values, accessor or utils.get_value)
+    schema.__accessor__ = accessor
+    return accessor
+
+
+def _declared_only(field):
+    """Nested._serialize() calls _update_fields() with the first object on first use,
+    which inspects the object by getattr() (bypassing the accessor). if the nested schema has
+    only declared fields, the object is not needed, so updating it here (once) is enough."""
+    schema = field.schema
+    if schema.opts.fields or schema.opts.additional:
+        return
+    schema._update_fields(many=field.many)
+    field._Nested__updated_fields = True
+
+
+def prefetch(schema, obs, loaders, values=None, prefix=""):
+    """calling loaders with all objects needing an attribute at once.
+
+    loaders: {<dotted field name>: loader}. loader(objects) returns values, in the same order as objects.
+    (for Nested(many=True) fields, each value is a list)
+    """
+    if values is None:
+        values = {}
+    accessor = install(schema, values)
+    for name, field in schema.fields.items():
+        path = prefix + name
+        subprefix = path + "."
+        has_children = any(k.startswith(subprefix) for k in loaders)
+        if path not in loaders and not has_children:
+            continue
+        key = getattr(field, "attribute", None) or name
+        if path in loaders:
+            fetched = list(loaders[path](obs))
+            if len(fetched) != len(obs):
+                raise ValueError("loader for {!r} returns {} values, for {} objects".format(path, len(fetched), len(obs)))
+        else:
+            fetched = [accessor(key, ob) for ob in obs]
+        is_many = hasattr(field, "nested") and field.many
+        if is_many:
+            fetched = [None if v is None else list(v) for v in fetched]
+        # the values fetched by the original accessor are stored, too.
+        # (a lazy relation may return new objects on each access, and their children are prefetched)
+        for ob, v in zip(obs, fetched):
+            values[(id(ob), key)] = (ob, v)
+        if has_children and hasattr(field, "nested"):
+            _declared_only(field)
+            if is_many:
+                children = [c for v in fetched if v for c in v]
+            else:
+                children = [v for v in fetched if v is not None]
+            prefetch(field.schema, children, loaders, values=values, prefix=subprefix)
+    return values
+
@@ -0,0 +1,46 @@
+# -*- coding:utf-8 -*-
+import gc
+import weakref
+
+
+class FormRegistry(object):
+    """every form class created by FormMeta.
+
+    warmup() builds lazily built structures (schema class, cleansing plan, layout plan) eagerly,
+    e.g. before a pre-fork server forks, so that workers share them.
+    """
+
+    def __init__(self):
+        self.forms = weakref.WeakSet()  # dynamically created forms can be collected
+
+    def add(self, formclass):
+        self.forms.add(formclass)
+        return formclass
+
+    def __contains__(self, formclass):
+        return formclass in self.forms
+
+    def __iter__(self):
+        return iter(list(self.forms))
+
+    def __len__(self):
+        return len(self.forms)
+
+    def warmup(self, freeze=False, cache=None):
+        """if freeze is true, gc.freeze() is called after warmup (python3.7+).
+        cache is a PlanCache, used for cold start (see FormMeta.warmup())
+        """
+        formclasses = list(self.forms)
+        for formclass in formclasses:
+            formclass.warmup(cache=cache)
+        if freeze and hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+        return formclasses
+
+
+registry = FormRegistry()
+
+
+def warmup(freeze=False, cache=None):
+    return registry.warmup(freeze=freeze, cache=cache)
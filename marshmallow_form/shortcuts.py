@@ -0,0 +1,56 @@
+# -*- coding:utf-8 -*-
+from functools import partial
+from marshmallow import fields
+from .boundfield import field
+
+
+def field_factory(marshmallow_field, **options):
+    if "required" not in options:
+        options["required"] = True
+    return partial(field, marshmallow_field, **options)
+
+
+def select_wrap(pairs, *args, **kwargs):
+    choices = [p[0] for p in pairs]
+    kwargs["pairs"] = pairs
+    return fields.Select(choices, *args, **kwargs)
+
+
+def nested_wrap(formclass, *args, **kwargs):
+    schema = formclass.Schema
+    kwargs.update(kwargs.pop("overrides", {}))
+    return fields.Nested(schema, *args, **kwargs)
+
+
+Nested = field_factory(nested_wrap)
+Any = field_factory(fields.Field)
+Price = field_factory(fields.Price)
+Arbitrary = field_factory(fields.Arbitrary)
+Decimal = field_factory(fields.Decimal)
+DateTime = field_factory(fields.DateTime)
+URL = field_factory(fields.URL)
+Time = field_factory(fields.Time)
+Str = field_factory(fields.Str)
+Bool = field_factory(fields.Bool)
+String = field_factory(fields.String)
+Url = field_factory(fields.Url)
+LocalDateTime = field_factory(fields.LocalDateTime)
+Float = field_factory(fields.Float)
+Email = field_factory(fields.Email)
+Date = field_factory(fields.Date)
+Int = field_factory(fields.Int)
+TimeDelta = field_factory(fields.TimeDelta)
+UUID = field_factory(fields.UUID)
+Function = field_factory(fields.Function)
+FormattedString = field_factory(fields.FormattedString)
+Number = field_factory(fields.Number)
+Method = field_factory(fields.Method)
+Raw = field_factory(fields.Raw)
+Select = field_factory(select_wrap)
+Fixed = field_factory(fields.Fixed)
+QuerySelect = field_factory(fields.QuerySelect)
+ValidatedField = field_factory(fields.ValidatedField)
+Integer = field_factory(fields.Integer)
+QuerySelectList = field_factory(fields.QuerySelectList)
+Boolean = field_factory(fields.Boolean)
+List = field_factory(fields.List)
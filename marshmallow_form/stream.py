@@ -0,0 +1,93 @@
+# -*- coding:utf-8 -*-
+import json
+from marshmallow.compat import basestring
+from marshmallow.fields import missing
+from marshmallow.exceptions import MarshallingError
+
+
+class Rows(object):
+    """serialized elements of Nested(many=True) field. each element is dumped on iteration"""
+
+    def __init__(self, key, schema, values):
+        self.key = key
+        self.schema = schema
+        self.values = values
+
+    def __iter__(self):
+        return dump_rows(self.key, self.schema, enumerate(self.values))
+
+
+def dump_rows(key, schema, rows):
+    """dumping (index, element) pairs one by one. the fields are updated by the first element only"""
+    update_fields = True
+    for i, v in rows:
+        result = schema.dump(v, many=False, update_fields=update_fields)
+        update_fields = False
+        if result.errors:
+            raise MarshallingError({key: {i: result.errors}})
+        yield result.data
+
+
+def needs_whole_dump(schema):
+    """postprocessing (data handlers, extra) needs whole result"""
+    return bool(schema.__data_handlers__ or schema.extra)
+
+
+def dump_whole(schema, ob):
+    result = schema.dump(ob, update_fields=False)
+    if result.errors:
+        raise MarshallingError(result.errors)
+    return result.data
+
+
+def _is_streamable(field):
+    return getattr(field, "many", False) and hasattr(field, "nested") and not isinstance(field.only, basestring)
+
+
+def iterate_items(schema, ob):
+    """(key, value) pairs of serialized ob, field by field.
+    the value of Nested(many=True) field is Rows (an iterable of per-element dicts)
+
+    raising MarshallingError on first error (same as FormBase.serialize())
+    """
+    if needs_whole_dump(schema):
+        for item in dump_whole(schema, ob).items():
+            yield item
+        return
+
+    accessor = schema.__accessor__
+    prefix = schema.prefix
+    skip_missing = schema.skip_missing
+    for name, field in schema.fields.items():
+        key = prefix + name
+        try:
+            if _is_streamable(field):
+                values = field.get_value(name, ob, accessor=accessor)
+                value = Rows(key, field.schema, values or ())
+            else:
+                value = field.serialize(name, ob, accessor=accessor)
+        except MarshallingError as e:
+            raise MarshallingError({key: [str(e)]})
+        if value is missing or (skip_missing and not isinstance(value, Rows) and value in field.SKIPPABLE_VALUES):
+            continue
+        yield key, value
+
+
+def iterate_json(items, dumps=None):
+    """JSON text chunks. "".join(chunks) is the same as json.dumps() of whole result"""
+    dumps = dumps or json.dumps
+    yield "{"
+    sep = ""
+    for k, v in items:
+        yield "{}{}: ".format(sep, dumps(k))
+        if isinstance(v, Rows):
+            yield "["
+            rowsep = ""
+            for row in v:
+                yield rowsep + dumps(row)
+                rowsep = ", "
+            yield "]"
+        else:
+            yield dumps(v)
+        sep = ", "
+    yield "}"
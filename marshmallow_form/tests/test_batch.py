@@ -0,0 +1,143 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+class Catalog(object):
+    """sqlite3 stand-in for a product table, with query counting"""
+
+    def __init__(self, skus):
+        import sqlite3
+        self.conn = sqlite3.connect(":memory:")
+        self.count = 0
+        self.conn.execute("create table product (sku text primary key)")
+        self.conn.executemany("insert into product values (?)", [(sku, ) for sku in skus])
+
+    def existing(self, skus):
+        self.count += 1
+        skus = list(skus)
+        sql = "select sku from product where sku in ({})".format(", ".join("?" * len(skus)))
+        return set(row[0] for row in self.conn.execute(sql, skus))
+
+
+def makeItemForm(catalog):
+    import marshmallow_form as mf
+
+    class ItemForm(mf.Form):
+        sku = mf.String()
+        qty = mf.Int()
+
+        @mf.Form.batch_validator("sku")
+        def sku_exists(schema, values):
+            found = catalog.existing(set(values.values()))
+            return {i: "unknown sku" for i, v in values.items() if v not in found}
+
+        @mf.Form.batch_validator("sku")
+        def no_duplicates(schema, values):
+            seen = set()
+            errors = {}
+            for i, v in values.items():
+                if v in seen:
+                    errors[i] = ["duplicated"]
+                seen.add(v)
+            return errors
+    return ItemForm
+
+
+@test_target("marshmallow_form:Form")
+class NestedManyTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+        self.catalog = Catalog(["a{}".format(i) for i in range(100)])
+        ItemForm = makeItemForm(self.catalog)
+
+        class OrderForm(self._getTarget()):
+            name = mf.String()
+            items = mf.Nested(ItemForm, many=True)
+        return OrderForm(*args, **kwargs)
+
+    def test_valid(self):
+        data = {"name": "foo"}
+        for i in range(50):
+            data["items.{}.sku".format(i)] = "a{}".format(i)
+            data["items.{}.qty".format(i)] = "1"
+        form = self._makeOne(data)
+        self.assertTrue(form.validate())
+        self.assertEqual(len(form.data["items"]), 50)
+        self.assertEqual(self.catalog.count, 1)
+
+    def test_per_row_errors(self):
+        data = {"name": "foo",
+                "items.0.sku": "a1", "items.0.qty": "1",
+                "items.1.sku": "x", "items.1.qty": "1",
+                "items.2.sku": "a1", "items.2.qty": "1"}
+        form = self._makeOne(data)
+        self.assertFalse(form.validate())
+        self.assertEqual(form.errors, {"items": {1: {"sku": ["unknown sku"]}, 2: {"sku": ["duplicated"]}}})
+        self.assertEqual(self.catalog.count, 1)
+
+    def test_single_form(self):
+        self.catalog = Catalog(["a1"])
+        Form = makeItemForm(self.catalog)
+        form = Form({"sku": "x", "qty": "1"})
+        self.assertFalse(form.validate())
+        self.assertEqual(form.errors, {"sku": ["unknown sku"]})
+        self.assertTrue(Form({"sku": "a1", "qty": "1"}).validate())
+
+    def test_error_handler(self):
+        import marshmallow_form as mf
+        handled = []
+        ItemForm = makeItemForm(Catalog(["a1"]))
+
+        class OrderForm(mf.Form):
+            items = mf.Nested(ItemForm, many=True)
+
+            @mf.Form.error_handler
+            def handle(schema, errors, data):
+                handled.append(errors)
+
+        form = OrderForm({"items.0.sku": "x", "items.0.qty": "1"})
+        self.assertFalse(form.validate())
+        self.assertEqual(handled, [{"items": {0: {"sku": ["unknown sku"]}}}])
+
+    def test_error_handler__single_form(self):
+        import marshmallow_form as mf
+        handled = []
+
+        class Form(makeItemForm(Catalog(["a1"]))):
+            @mf.Form.error_handler
+            def handle(schema, errors, data):
+                handled.append(dict(errors))
+
+        self.assertFalse(Form({"sku": "x", "qty": "1"}).validate())
+        self.assertEqual(handled, [{"sku": ["unknown sku"]}])
+
+
+@test_target("marshmallow_form.formset:FormSet")
+class FormSetTests(unittest.TestCase):
+    def test_it(self):
+        catalog = Catalog(["a1", "a2"])
+        data = {"r0-sku": "a1", "r0-qty": "1", "r1-sku": "x", "r1-qty": "1", "r2-sku": "a1", "r2-qty": "@"}
+        target = self._getTarget()(makeItemForm(catalog), ["r0-", "r1-", "r2-"], data)
+        self.assertFalse(target.validate())
+        self.assertEqual(catalog.count, 1)
+        self.assertEqual(target.errors, {"r1-": {"sku": ["unknown sku"]},
+                                         "r2-": {"qty": ["invalid literal for int() with base 10: '@'"],
+                                                 "sku": ["duplicated"]}})
+        self.assertIs(target["r2-"].errors, target.errors["r2-"])
+
+    def test_touched_and_handled(self):
+        import marshmallow_form as mf
+        handled = []
+
+        class Form(makeItemForm(Catalog(["a1"]))):
+            @mf.Form.error_handler
+            def handle(schema, errors, data):
+                handled.append(dict(errors))
+
+        data = {"r0-sku": "a1", "r0-qty": "1", "r1-sku": "x", "r1-qty": "1"}
+        target = self._getTarget()(Form, ["r0-", "r1-"], data)
+        target.deserialize()
+        self.assertEqual(handled, [{"sku": ["unknown sku"]}])
+        self.assertEqual(target["r1-"]._generation, target["r0-"]._generation + 1)  # touched by batch errors
+        self.assertEqual(target["r1-"].sku.errors, ["unknown sku"])
@@ -0,0 +1,86 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+@test_target("marshmallow_form:Form")
+class DumpChangesTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+        from marshmallow import fields
+
+        serialized = self.serialized = []
+
+        class Text(fields.String):
+            def _serialize(self, value, attr, obj):
+                serialized.append(value)
+                return super(Text, self)._serialize(value, attr, obj)
+
+        class AuthorForm(self._getTarget()):
+            name = mf.String()
+
+        class CommentForm(self._getTarget()):
+            id = mf.Int()
+            text = mf.field(Text)
+
+        class PostForm(self._getTarget()):
+            title = mf.field(Text)
+            body = mf.field(Text)
+            author = mf.Nested(AuthorForm)
+            comments = mf.Nested(CommentForm, many=True)
+        return PostForm(*args, **kwargs)
+
+    def _makeObject(self, n=3):
+        return {"title": "hello", "body": "long text", "author": {"name": "foo"},
+                "comments": [{"id": i, "text": "hmm{}".format(i)} for i in range(n)]}
+
+    def test_first_dump_is_full(self):
+        form = self._makeOne()
+        ob = self._makeObject()
+        patch, snapshot = form.dump_changes(ob)
+        self.assertEqual(patch, form.serialize(ob))
+        self.assertEqual(sorted(snapshot.keys()), ["author", "body", "comments", "title"])
+        self.assertEqual(len(snapshot["comments"]), 3)
+
+    def test_unchanged(self):
+        form = self._makeOne()
+        ob = self._makeObject()
+        _, snapshot = form.dump_changes(ob)
+        self.serialized[:] = []
+        patch, new_snapshot = form.dump_changes(ob, since=snapshot)
+        self.assertEqual(patch, {})
+        self.assertEqual(new_snapshot, snapshot)
+        self.assertEqual(self.serialized, [])
+
+    def test_changed_field_and_row(self):
+        form = self._makeOne()
+        ob = self._makeObject()
+        _, snapshot = form.dump_changes(ob)
+        self.serialized[:] = []
+        ob["title"] = "bye"
+        ob["author"]["name"] = "bar"
+        ob["comments"][1]["text"] = "changed"
+        ob["comments"].append({"id": 3, "text": "new"})
+        patch, _ = form.dump_changes(ob, since=snapshot)
+        self.assertEqual(patch, {"title": "bye", "author": {"name": "bar"},
+                                 "comments.1": {"id": 1, "text": "changed"},
+                                 "comments.3": {"id": 3, "text": "new"}})
+        self.assertEqual(sorted(self.serialized), ["bye", "changed", "new"])
+
+    def test_removed_rows(self):
+        form = self._makeOne()
+        ob = self._makeObject()
+        _, snapshot = form.dump_changes(ob)
+        del ob["comments"][0]
+        patch, snapshot = form.dump_changes(ob, since=snapshot)
+        self.assertEqual(patch, {"comments": [{"id": 1, "text": "hmm1"}, {"id": 2, "text": "hmm2"}]})
+        self.assertEqual(len(snapshot["comments"]), 2)
+
+    def test_type_change_is_detected(self):
+        form = self._makeOne()
+        ob = self._makeObject()
+        ob["comments"][0]["id"] = 1
+        _, snapshot = form.dump_changes(ob)
+        ob["comments"][0]["id"] = "1"
+        patch, _ = form.dump_changes(ob, since=snapshot)
+        self.assertEqual(list(patch.keys()), ["comments.0"])
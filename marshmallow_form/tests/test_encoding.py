@@ -0,0 +1,81 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+@test_target("marshmallow_form:Form")
+class SerializeJSONTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+
+        class ItemForm(self._getTarget()):
+            name = mf.String()
+            price = mf.Decimal()
+            uid = mf.UUID()
+            created_at = mf.DateTime()
+            extra = mf.Raw()
+        return ItemForm(*args, **kwargs)
+
+    def _makeObject(self):
+        import uuid
+        import decimal
+        import datetime
+        return {"name": "りんご", "price": decimal.Decimal("1.10"),
+                "uid": uuid.UUID("12345678123456781234567812345678"),
+                "created_at": datetime.datetime(2000, 1, 1),
+                "extra": {"d": datetime.date(2000, 1, 1)}}
+
+    def test_it(self):
+        import json
+        result = self._makeOne().serialize_json(self._makeObject())
+        self.assertIsInstance(result, bytes)
+        self.assertEqual(json.loads(result.decode("utf-8")), {
+            "name": "りんご", "price": "1.10", "uid": "12345678-1234-5678-1234-567812345678",
+            "created_at": "2000-01-01T00:00:00+00:00", "extra": {"d": "2000-01-01"}})
+
+    def test_encoders_are_compatible(self):
+        from marshmallow_form import encoding
+        if encoding.orjson is None:
+            self.skipTest("orjson is not installed")
+        form = self._makeOne()
+        ob = self._makeObject()
+        self.assertEqual(form.serialize_json(ob, dumps=encoding.stdlib_dumps),
+                         form.serialize_json(ob, dumps=encoding.orjson_dumps))
+
+    def test_unknown_type(self):
+        from marshmallow_form import encoding
+        with self.assertRaises(TypeError):
+            encoding.stdlib_dumps({"x": object()})
+
+
+class EncodersTests(unittest.TestCase):
+    # without marshmallow (runs wherever orjson is installed)
+    def test_compatible(self):
+        import uuid
+        import decimal
+        import datetime
+        from marshmallow_form import encoding
+        if encoding.orjson is None:
+            self.skipTest("orjson is not installed")
+        data = {"name": "りんご", "price": decimal.Decimal("1.10"), "uid": uuid.UUID(int=1),
+                "rows": [{"id": 1, "f": 1.5, "b": True, "n": None}],
+                "dt": datetime.datetime(2000, 1, 1, 1, 2, 3, 4), "d": datetime.date(2000, 1, 1),
+                "t": datetime.time(1, 2, 3), "s": "\"q\" \\ \n"}
+        self.assertEqual(encoding.stdlib_dumps(data), encoding.orjson_dumps(data))
+
+        for data in [{1: "a", "b": {2: [3]}}, {"n": 2 ** 70}, {"f": [float("nan"), float("inf"), 1.0]}]:
+            self.assertEqual(encoding.stdlib_dumps(data), encoding.orjson_dumps(data))
+
+    def test_not_finite(self):
+        import json
+        from marshmallow_form import encoding
+        result = encoding.stdlib_dumps({"f": (float("nan"), -float("inf"))})
+        self.assertEqual(result, b'{"f":[null,null]}')
+        self.assertEqual(json.loads(result.decode("utf-8")), {"f": [None, None]})
+
+    def test_circular(self):
+        from marshmallow_form import encoding
+        d = {}
+        d["d"] = d
+        with self.assertRaises(ValueError):
+            encoding.stdlib_dumps(d)
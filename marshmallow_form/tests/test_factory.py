@@ -61,3 +61,63 @@ class FactoryTests(unittest.TestCase):
         result = {f.name: f.value for f in form}
         expected = {"name": "foo.txt", "ctime.year": 2000, "ctime.month": 1, "ctime.day": 1}
         self.assertEqual(result, expected)
+
+
+@test_function("marshmallow_form:cached_form_factory")
+class CachedFactoryTests(unittest.TestCase):
+    def _makeSchema(self):
+        from marshmallow import Schema, fields
+
+        class PersonSchema(Schema):
+            name = fields.String()
+            age = fields.Int()
+        return PersonSchema
+
+    def _makeCache(self, maxsize=10):
+        from marshmallow_form.langhelpers import WeakValueLRUCache
+        return WeakValueLRUCache(maxsize)
+
+    def test_same_class(self):
+        schema = self._makeSchema()
+        cache = self._makeCache()
+
+        class Meta:
+            overrides = {"name": {"label": "name"}}
+
+        class Meta2:
+            overrides = {"name": {"label": "name"}}
+        Form = self._callFUT("PersonForm", schema, meta=Meta, cache=cache)
+        self.assertIs(self._callFUT("PersonForm", schema, meta=Meta2, cache=cache), Form)
+        self.assertEqual(Form().name["label"], "name")
+
+    def test_different_arguments(self):
+        schema = self._makeSchema()
+        cache = self._makeCache()
+        Form = self._callFUT("PersonForm", schema, cache=cache)
+        self.assertIsNot(self._callFUT("PersonForm", self._makeSchema(), cache=cache), Form)
+        self.assertIsNot(self._callFUT("PersonForm", schema, attrs={"x": 1}, cache=cache), Form)
+
+    def test_same_attrs_dict(self):
+        schema = self._makeSchema()
+        cache = self._makeCache()
+        attrs = {"x": 1}
+        Form = self._callFUT("PersonForm", schema, attrs=attrs, cache=cache)
+        self.assertEqual(attrs, {"x": 1})
+        self.assertIs(self._callFUT("PersonForm", schema, attrs=attrs, cache=cache), Form)
+
+    def test_unhashable_arguments(self):
+        schema = self._makeSchema()
+        cache = self._makeCache()
+        attrs = {"x": object.__new__(type("Unhashable", (object, ), {"__hash__": None}))}
+        Form = self._callFUT("PersonForm", schema, attrs=attrs, cache=cache)
+        self.assertIsNot(self._callFUT("PersonForm", schema, attrs=attrs, cache=cache), Form)
+        self.assertEqual(len(cache), 0)
+
+    def test_bounded(self):
+        import gc
+        cache = self._makeCache(maxsize=2)
+        for i in range(5):
+            self._callFUT("PersonForm", self._makeSchema(), cache=cache)
+        gc.collect()
+        self.assertEqual(len(cache.recent), 2)
+        self.assertLessEqual(len(cache), 2)
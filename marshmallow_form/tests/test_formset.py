@@ -0,0 +1,56 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+@test_target("marshmallow_form.formset:FormSet")
+class FormSetTests(unittest.TestCase):
+    def _getForm(self):
+        import marshmallow_form as mf
+
+        class PersonForm(mf.Form):
+            name = mf.String()
+            age = mf.Integer()
+        return PersonForm
+
+    def _makeOne(self, *args, **kwargs):
+        return self._getTarget()(self._getForm(), *args, **kwargs)
+
+    def test_partition(self):
+        input_data = {"a-name": "foo", "a-age": "10", "b-name": "bar", "b-age": "20", "c-name": "boo", "csrf": "x"}
+        target = self._makeOne(["a-", "b-"], input_data)
+        self.assertEqual(target["a-"].rawdata, {"a-name": "foo", "a-age": "10"})
+        self.assertEqual(target["b-"].rawdata, {"b-name": "bar", "b-age": "20"})
+        self.assertEqual(target.prefixes, ["a-", "b-"])
+
+    def test_shared_schema(self):
+        target = self._makeOne(["a-", "b-"], {})
+        a, b = list(target)
+        self.assertIs(a.schema, b.schema)
+        self.assertIs(a.cleansing_plan, b.cleansing_plan)
+
+    def test_deserialize(self):
+        input_data = {"a-name": "foo", "a-age": "10", "b-name": "bar", "b-age": "20"}
+        target = self._makeOne(["a-", "b-"], input_data)
+        result = target.deserialize()
+        self.assertFalse(target.has_errors())
+        self.assertEqual(result, [{"name": "foo", "age": 10}, {"name": "bar", "age": 20}])
+
+    def test_errors(self):
+        input_data = {"a-name": "foo", "a-age": "10", "b-name": "bar", "b-age": "@@"}
+        target = self._makeOne(["a-", "b-"], input_data)
+        self.assertFalse(target.validate())
+        self.assertEqual(list(target.errors.keys()), ["b-"])
+        self.assertEqual(list(target.errors["b-"].keys()), ["age"])
+        self.assertTrue(target["b-"].age.errors)
+
+    def test_longest_prefix(self):
+        input_data = {"form-1-name": "foo", "form-1-age": "10", "form-10-name": "bar", "form-10-age": "20",
+                      "form-name": "x"}
+        target = self._makeOne(["form-1-", "form-10-"], input_data)
+        self.assertEqual(target["form-1-"].rawdata, {"form-1-name": "foo", "form-1-age": "10"})
+        self.assertEqual(target["form-10-"].rawdata, {"form-10-name": "bar", "form-10-age": "20"})
+
+        target = self._makeOne(["a", "ab"], {"aname": "foo", "abname": "bar"})
+        self.assertEqual(target["a"].rawdata, {"aname": "foo"})
+        self.assertEqual(target["ab"].rawdata, {"abname": "bar"})
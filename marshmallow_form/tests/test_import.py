@@ -0,0 +1,51 @@
+# -*- coding:utf-8 -*-
+import os
+import sys
+import subprocess
+import unittest
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "-X importtime is python3.7+")
+class ImportTimeTests(unittest.TestCase):
+    budget = 30000  # usec (before lazy import, it was about 60000)
+
+    def _here(self):
+        import marshmallow_form
+        return os.path.dirname(os.path.dirname(os.path.abspath(marshmallow_form.__file__)))
+
+    def _importtime(self, code):
+        p = subprocess.Popen([sys.executable, "-X", "importtime", "-c", code], cwd=self._here(),
+                             stderr=subprocess.PIPE, universal_newlines=True)
+        _, err = p.communicate()
+        self.assertEqual(p.returncode, 0, err)
+        result = {}
+        for line in err.splitlines():
+            if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+                _, cumulative, name = line[len("import time:"):].split("|")
+                result[name.strip()] = int(cumulative)
+        return result
+
+    def test_marshmallow_is_not_imported(self):
+        result = self._importtime("import marshmallow_form")
+        self.assertIn("marshmallow_form", result)
+        self.assertNotIn("marshmallow", result)
+        self.assertNotIn("marshmallow_form.form", result)
+
+    def test_optional_modules_are_not_imported(self):
+        code = "import sys, marshmallow_form as mf; {}; print(' '.join(sorted(sys.modules)))"
+        optional = ["stream", "encoding", "prefetch", "changes", "tracking", "validationcontext", "batch"]
+        for access in ["pass", "mf.Form, mf.String"]:
+            out = subprocess.check_output([sys.executable, "-c", code.format(access)], cwd=self._here(),
+                                          universal_newlines=True)
+            modules = set(out.split())
+            for name in optional:
+                self.assertNotIn("marshmallow_form." + name, modules)
+
+    def test_budget(self):
+        best = min(self._importtime("import marshmallow_form")["marshmallow_form"] for _ in range(3))
+        self.assertLess(best, self.budget)
+
+    def test_resolved_on_access(self):
+        result = self._importtime("import marshmallow_form as mf; mf.String; mf.Form")
+        self.assertIn("marshmallow_form.shortcuts", result)
+        self.assertIn("marshmallow_form.form", result)
@@ -37,6 +37,16 @@ class RenderingTests(unittest.TestCase):
         result = list(f.name for f in form)
         self.assertEqual(result, ["name", "age"])
 
+    def test_bound_field_is_compact(self):
+        form = self._makeOne({"name": "foo"})
+        self.assertFalse(hasattr(form.name, "__dict__"))
+        self.assertEqual(form.name.value, "foo")
+        form.name.value = "bar"
+        self.assertEqual(form.name.value, "bar")
+        self.assertTrue(form.age.required)  # marshmallow field's attribute
+        with self.assertRaises(AttributeError):
+            form.name._missing
+
     def test_modify_metadata__no_effect_at_other_instance(self):
         form = self._makeOne()
         form.name.metadata["class"] = "js-name"
@@ -72,6 +82,41 @@ class RenderingTests(unittest.TestCase):
         result = list(f.name for f in other)
         self.assertEqual(result, ["name", "age"])
 
+    def test_add_field__base_schema_is_not_modified(self):
+        import marshmallow_form as mf
+        form = self._makeOne({"name": "foo", "age": "10", "birth": "2000-01-01"})
+        form.add_field("birth", mf.Date(required=True))
+        self.assertNotIn("birth", form.schema.fields)
+        result = form.deserialize()
+        self.assertFalse(form.has_errors())
+        self.assertEqual(sorted(result.keys()), ["age", "birth", "name"])
+
+    def test_remove_field__not_validated(self):
+        form = self._makeOne({"name": "foo"})
+        form.remove_field("age")
+        self.assertTrue(form.validate())
+        self.assertIn("age", form.schema.fields)
+        with self.assertRaises(AttributeError):
+            form.age
+
+    def test_remove_field__added(self):
+        import marshmallow_form as mf
+        form = self._makeOne()
+        form.add_field("birth", mf.Date())
+        form.remove_field("birth")
+        form.add_field("age", mf.Int())
+        self.assertEqual([f.name for f in form], ["name", "age"])
+        with self.assertRaises(ValueError):
+            form.remove_field("birth")
+
+    def test_add_field__shared_schema(self):
+        import marshmallow_form as mf
+        from marshmallow_form.formset import FormSet
+        formset = FormSet(self._makeOne().__class__, ["a-", "b-"], {"a-name": "foo", "a-age": "1", "b-name": "bar", "b-age": "2"})
+        formset["a-"].add_field("birth", mf.Date(required=False))
+        self.assertTrue(formset.validate())
+        self.assertEqual([f.name for f in formset["b-"]], ["name", "age"])
+
     def test_choices(self):
         import marshmallow_form as mf
         from collections import namedtuple
@@ -87,6 +132,77 @@ class RenderingTests(unittest.TestCase):
         self.assertEqual(result2, expected)
 
 
+@test_target("marshmallow_form:Form")
+class VariantTests(unittest.TestCase):
+    def _makeForm(self):
+        import marshmallow_form as mf
+
+        class PersonForm(self._getTarget()):
+            name = mf.String()
+            age = mf.Integer()
+        return PersonForm
+
+    def _makeCache(self):
+        from marshmallow_form.langhelpers import LRUCache
+        return LRUCache(maxsize=2)
+
+    def _callFUT(self, form_class, *args, **kwargs):
+        import marshmallow_form as mf
+        return form_class.variant("admin", [("note", mf.String()), ("rank", mf.Int())], *args, **kwargs)
+
+    def test_it(self):
+        Form = self._makeForm()
+        cache = self._makeCache()
+        Admin = self._callFUT(Form, remove=["age"], cache=cache)
+        self.assertTrue(issubclass(Admin, Form))
+        self.assertEqual(Admin.ordered_names, ["name", "note", "rank"])
+        form = Admin({"name": "foo", "note": "bar", "rank": "1"})
+        self.assertEqual(form.deserialize(), {"name": "foo", "note": "bar", "rank": 1})
+        with self.assertRaises(AttributeError):
+            form.age
+
+        self.assertEqual(Form.ordered_names, ["name", "age"])
+        self.assertEqual([f.name for f in Form()], ["name", "age"])
+
+    def test_cached(self):
+        Form = self._makeForm()
+        cache = self._makeCache()
+        Admin = self._callFUT(Form, remove=["age"], cache=cache)
+        self.assertIs(self._callFUT(Form, remove=["age"], cache=cache), Admin)
+        self.assertIsNot(self._callFUT(Form, cache=cache), Admin)
+
+    def test_cached__by_field_definition(self):
+        import marshmallow_form as mf
+        Form = self._makeForm()
+        cache = self._makeCache()
+        A = Form.variant("x", add={"f": mf.String()}, cache=cache)
+        self.assertIs(Form.variant("x", add={"f": mf.String()}, cache=cache), A)
+        B = Form.variant("x", add={"f": mf.Integer()}, cache=cache)
+        self.assertIsNot(B, A)
+        self.assertIsNot(Form.variant("x", add={"f": mf.String(required=False)}, cache=cache), A)
+        self.assertEqual(B({"name": "foo", "age": "1", "f": "10"}).deserialize()["f"], 10)
+
+    def test_marshmallow_field(self):
+        from marshmallow import fields
+        Form = self._makeForm()
+        Variant = Form.variant("v", add={"rank": fields.Integer()}, remove=["age"], cache=self._makeCache())
+        self.assertEqual(Variant.ordered_names, ["name", "rank"])
+        form = Variant({"name": "foo", "rank": "1"})
+        self.assertEqual(form.deserialize(), {"name": "foo", "rank": 1})
+        self.assertEqual(form.rank.value, 1)
+
+    def test_inherit_variant(self):
+        import marshmallow_form as mf
+        Admin = self._callFUT(self._makeForm(), remove=["age"], cache=self._makeCache())
+
+        class SubForm(Admin):
+            birth = mf.Date(required=False)
+
+        form = SubForm({"name": "foo", "note": "bar", "rank": "1"})
+        self.assertTrue(form.validate())
+        self.assertEqual([f.name for f in form], ["name", "note", "rank", "birth"])
+
+
 @test_target("marshmallow_form:Form")
 class FromObjectTests(unittest.TestCase):
     def test_it(self):
@@ -229,6 +345,36 @@ class MetaDataTests(unittest.TestCase):
         form = Form()
         self.assertEqual(form.name["doc"], "this is name")
 
+    def test_field__interned(self):
+        Class = self._getTarget()
+
+        class Form(Class):
+            name = self._makeField(doc="text", widget="str")
+            nickname = self._makeField(doc="text", widget="str")
+            age = self._makeField(doc="text", widget=1)
+            kind = self._makeField(doc="text", pairs=[("a", "A")])
+
+        self.assertIs(Form.name.field.metadata, Form.nickname.field.metadata)
+        self.assertIsNot(Form.name.field.metadata, Form.age.field.metadata)
+        with self.assertRaises(TypeError):
+            Form.name.field.metadata["doc"] = "changed"
+        self.assertEqual(Form.kind.field.metadata["pairs"], [("a", "A")])
+
+    def test_field__interned__modified_by_instance(self):
+        Class = self._getTarget()
+
+        class Form(Class):
+            name = self._makeField(doc="text")
+            nickname = self._makeField(doc="text")
+
+            class Meta:
+                overrides = {"nickname": {"doc": "overridden"}}
+        form = Form()
+        form.name.metadata["doc"] = "changed"
+        self.assertEqual(form.name["doc"], "changed")
+        self.assertEqual(form.nickname["doc"], "overridden")
+        self.assertEqual(Form().name["doc"], "text")
+
     def test_field_nested(self):
         Class = self._getTarget()
 
@@ -310,6 +456,43 @@ class MetaDataTests(unittest.TestCase):
         form = Form()
         self.assertEqual(form["doc"], "this is form")
 
+    def test_precomputed(self):
+        Class = self._getTarget()
+
+        class Named(Class):
+            name = self._makeField(doc="this is name", widget="str")
+
+        class Form(Class):
+            box = self._makeNested(Named, overrides={"name": {"doc": "this is box name"}})
+
+            class Meta:
+                overrides = {"box": {"label": "box"}}
+
+        self.assertEqual(Form.field_metadata["box.name"], {"doc": "this is box name", "widget": "str"})
+        self.assertEqual(Form.field_metadata["box"]["label"], "box")
+        with self.assertRaises(TypeError):
+            Form.field_metadata["box"]["label"] = "changed"
+
+    def test_precomputed__write_is_instance_local(self):
+        Class = self._getTarget()
+
+        class Form(Class):
+            name = self._makeField(doc="this is name")
+
+        form = Form()
+        form.name.metadata["doc"] = "changed"
+        self.assertEqual(form.name["doc"], "changed")
+        self.assertEqual(Form().name["doc"], "this is name")
+
+    def test_instance_overrides(self):
+        Class = self._getTarget()
+
+        class Form(Class):
+            name = self._makeField(doc="this is name")
+
+        form = Form(metadata={"name": {"doc": "*this is name*"}})
+        self.assertEqual(form.name["doc"], "*this is name*")
+
     def test_change_itemgetter(self):
         Class = self._getTarget()
 
@@ -441,3 +624,203 @@ class NestedTests2(unittest.TestCase):
                     'y1': {'x1': {'name': ''},
                            'x0': {'name': ''}}}
         self.assertEqual(result, expected)
+
+
+@test_target("marshmallow_form:Form")
+class IterationCacheTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+
+        from marshmallow_form.layout import FlattenLayout
+
+        class CountingLayout(FlattenLayout):
+            called = 0
+
+            def __call__(self, form):
+                self.called += 1
+                return super(CountingLayout, self).__call__(form)
+
+        class PersonForm(self._getTarget()):
+            name = mf.String()
+            age = mf.Integer()
+
+        PersonForm.layout = CountingLayout()
+        return PersonForm(*args, **kwargs)
+
+    def test_cached(self):
+        form = self._makeOne()
+        first = list(form)
+        second = list(form)
+        self.assertEqual(form.layout.called, 1)
+        self.assertEqual([id(f) for f in first], [id(f) for f in second])
+
+    def test_invalidated__add_field(self):
+        import marshmallow_form as mf
+        form = self._makeOne()
+        list(form)
+        form.add_field("birth", mf.Date())
+        self.assertEqual([f.name for f in form], ["name", "age", "birth"])
+        form.remove_field("age")
+        self.assertEqual([f.name for f in form], ["name", "birth"])
+        self.assertEqual(form.layout.called, 3)
+
+    def test_invalidated__deserialize(self):
+        form = self._makeOne()
+        list(form)
+        generation = form._generation
+        form.deserialize({"name": "foo", "age": "10"})
+        self.assertGreater(form._generation, generation)
+        list(form)
+        self.assertEqual(form.layout.called, 2)
+
+
+@test_target("marshmallow_form:Form")
+class FieldNameTests(unittest.TestCase):
+    def test_field_named_state(self):
+        import marshmallow_form as mf
+
+        class AddressForm(self._getTarget()):
+            city = mf.String()
+            state = mf.String()
+
+        form = AddressForm({"city": "Boston", "state": "MA"})
+        self.assertTrue(form.validate())
+        self.assertEqual([f.name for f in form], ["city", "state"])
+        self.assertEqual(form.state.value, "MA")
+        form.add_field("zip", mf.String())
+        self.assertEqual([f.name for f in form], ["city", "state", "zip"])
+
+    def test_field_named_generation(self):
+        import marshmallow_form as mf
+
+        class CarForm(self._getTarget()):
+            model = mf.String()
+            generation = mf.Int()
+
+        form = CarForm({"model": "civic", "generation": "11"})
+        self.assertTrue(form.validate())
+        self.assertEqual(form.data, {"model": "civic", "generation": 11})
+        self.assertEqual(form.generation.value, 11)
+        self.assertEqual([f.name for f in form], ["model", "generation"])
+
+    def test_nested_field_names(self):
+        import marshmallow_form as mf
+
+        class OptionForm(self._getTarget()):
+            table = mf.String()
+            flat = mf.Bool()
+            generation = mf.Int()
+
+        class ParentForm(self._getTarget()):
+            option = mf.Nested(OptionForm)
+
+        form = ParentForm({"option.table": "t", "option.flat": "true", "option.generation": "3"})
+        self.assertTrue(form.validate())
+        self.assertEqual(form.option.table.value, "t")
+        self.assertEqual(form.option.flat.value, True)
+        self.assertEqual(form.option.generation.value, 3)
+        self.assertEqual([f.name for f in form.option], ["option.table", "option.flat", "option.generation"])
+
+    def test_field_named_json(self):
+        import marshmallow_form as mf
+
+        class DateTriple(self._getTarget()):
+            year = mf.Int()
+
+        class ApiForm(self._getTarget()):
+            json = mf.String()
+            ctime = mf.Nested(DateTriple)
+
+        form = ApiForm({"json": "a", "ctime.year": "2000"})
+        self.assertTrue(form.validate())
+        self.assertEqual(form.data, {"json": "a", "ctime": {"year": 2000}})
+
+
+@test_target("marshmallow_form:Form")
+class LazySchemaTests(unittest.TestCase):
+    def _makeClass(self, called):
+        import marshmallow_form as mf
+
+        class PersonForm(self._getTarget()):
+            name = mf.String()
+
+            @mf.Form.validator
+            def check(schema, data):
+                called.append(data)
+        return PersonForm
+
+    def test_not_built_until_accessed(self):
+        called = []
+        PersonForm = self._makeClass(called)
+        self.assertNotIn("_schema_class", PersonForm.__dict__)
+        self.assertEqual(PersonForm.Schema.__name__, "PersonSchema")
+        self.assertIn("_schema_class", PersonForm.__dict__)
+        self.assertIs(PersonForm.Schema, PersonForm().Schema)
+
+    def test_warmup(self):
+        PersonForm = self._makeClass([])
+        self.assertIs(PersonForm.warmup(), PersonForm)
+        self.assertIn("_schema_class", PersonForm.__dict__)
+
+    def test_handlers_registered_on_build(self):
+        import marshmallow_form as mf
+        called = []
+        PersonForm = self._makeClass(called)
+
+        class StudentForm(PersonForm):
+            school = mf.String()
+
+        form = StudentForm({"name": "foo", "school": "bar"})
+        self.assertTrue(form.validate())
+        self.assertEqual(called, [{"name": "foo", "school": "bar"}])
+        self.assertTrue(issubclass(StudentForm.Schema, PersonForm.Schema))
+
+
+@test_target("marshmallow_form:Form")
+class ReferenceCycleTests(unittest.TestCase):
+    def _makeClass(self):
+        import marshmallow_form as mf
+
+        class CommentForm(self._getTarget()):
+            author = mf.String()
+            score = mf.Int()
+
+        class ArticleForm(self._getTarget()):
+            title = mf.String()
+            ctime = mf.Nested(CommentForm)
+            comments = mf.Nested(CommentForm, many=True)
+        return ArticleForm
+
+    def _use(self, form):
+        # field level errors are not used here. (marshmallow 1.x itself leaves a cycle of traceback and frames)
+        form.validate()
+        form.errors = {"title": ["too long"], "comments": {"_schema": ["oops"]}}
+        form.touch()
+        for f in form:
+            for bf in f:
+                bf.value, bf.metadata, bf.fullerrors
+        form.dump(form.data)
+
+    def test_freed_by_refcount(self):
+        import gc
+        import weakref
+        data = {"title": "foo", "ctime.author": "a", "ctime.score": "1",
+                "comments.0.author": "a", "comments.0.score": "1"}
+        ArticleForm = self._makeClass()
+        self._use(ArticleForm(data))  # building schema classes, plans and so on
+
+        gc.collect()
+        gc.disable()
+        gc.set_debug(gc.DEBUG_SAVEALL)
+        try:
+            form = ArticleForm(data)
+            self._use(form)
+            ref = weakref.ref(form)
+            del form
+            self.assertIsNone(ref())
+            self.assertEqual(gc.collect(), 0)
+            self.assertEqual(gc.garbage, [])
+        finally:
+            gc.set_debug(0)
+            gc.enable()
+            del gc.garbage[:]
@@ -86,6 +86,26 @@ class LayoutTests(unittest.TestCase):
         ]
         self.assertEqual(result, expected)
 
+    def test_build_iterator(self):
+        from marshmallow_form.layout import Layout, LColumn
+
+        class LayoutedForm(self._makeBase()):
+            class Meta:
+                layout = Layout([
+                    LColumn("father.name", "father.age", "mother.name", "mother.age", widget="row"),
+                    ["info.zip", "info.tel"],
+                    LColumn("info.address.country",
+                            "info.address.prefecture",
+                            "info.address.city",
+                            "info.address.street", widget="row"),
+                ])
+        form = LayoutedForm()
+        layout = LayoutedForm.layout
+        result = transcribe(layout.build_iterator(form, layout.shape))
+        self.assertEqual(result, transcribe(form))
+        result = transcribe(layout.build_iterator(form, [LColumn("info.zip", "father.age", widget="col")]))
+        self.assertEqual(result, ["col:(info.zip, father.age)"])
+
     def test_layout__too_few(self):
         from marshmallow_form.layout import Layout, LayoutTooFew
         with self.assertRaises(LayoutTooFew):
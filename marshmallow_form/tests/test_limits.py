@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+@test_target("marshmallow_form:Form")
+class LimitsTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+
+        class DateTriple(self._getTarget()):
+            year = mf.Int()
+            month = mf.Int()
+            day = mf.Int()
+
+        class FileForm(self._getTarget()):
+            name = mf.String()
+            ctime = mf.Nested(DateTriple)
+
+            class Meta:
+                limits = {"max_keys": 5, "max_value_length": 10, "max_depth": 2}
+        return FileForm(*args, **kwargs)
+
+    def test_within_limits(self):
+        input_data = {"name": "foo", "ctime.year": "2000", "ctime.month": "1", "ctime.day": "1"}
+        form = self._makeOne(input_data)
+        self.assertTrue(form.validate())
+
+    def test_too_many_keys(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        input_data = {"name": "foo", "ctime.year": "2000", "ctime.month": "1", "ctime.day": "1", "x": "", "y": ""}
+        form = self._makeOne(input_data)
+        with self.assertRaises(InputTooLarge):
+            form.validate()
+
+    def test_too_long_value(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        form = self._makeOne({"name": "x" * 11})
+        with self.assertRaises(InputTooLarge):
+            form.validate()
+
+    def test_too_deep(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        form = self._makeOne({"a.b.c": "1"})
+        with self.assertRaises(InputTooLarge):
+            form.validate()
+        form = self._makeOne({"a": {"b": {"c": "1"}}})
+        with self.assertRaises(InputTooLarge):
+            form.deserialize(cleansing=False)
+
+    def test_too_long_list(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        form = self._makeOne({"name": ["x"] * 4}, limits={"max_list_length": 3})
+        with self.assertRaises(InputTooLarge):
+            form.validate()
+
+    def test_options_override__no_effect_at_other_instance(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        form = self._makeOne({"name": "x" * 11}, limits={"max_value_length": None})
+        form.validate()  # not raised
+        with self.assertRaises(InputTooLarge):
+            self._makeOne({"name": "x" * 11}).validate()
+
+    def test_field_named_limits(self):
+        import marshmallow_form as mf
+        from marshmallow_form.exceptions import InputTooLarge
+
+        class QuotaForm(self._getTarget()):
+            limits = mf.Int()
+
+            class Meta:
+                limits = {"max_value_length": 3}
+
+        form = QuotaForm({"limits": "10"})
+        self.assertTrue(form.validate())
+        self.assertEqual(form.limits.value, 10)
+        with self.assertRaises(InputTooLarge):
+            QuotaForm({"limits": "1000"}).validate()
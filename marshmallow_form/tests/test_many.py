@@ -66,3 +66,149 @@ class Tests(unittest.TestCase):
             ("texts.1.head", "^"), ("texts.1.body", "bar"),
         ]
         self.assertEqual(result, expected)
+
+    def test_cleansing_indexed_keys(self):
+        Class = self._getTarget()
+
+        class Text(Class):
+            head = self._makeString()
+            body = self._makeString()
+
+        class Form(Class):
+            title = self._makeString()
+            texts = self._makeNested(Text, many=True)
+
+        input_data = {
+            "title": "t",
+            "texts.1.body": "bar", "texts.0.head": "^",
+            "texts.0.body": "foo", "texts.1.head": "^",
+            "texts.x.body": "ignored",
+        }
+        form = Form(input_data)
+        result = form.cleansing()
+        expected = {
+            "title": "t",
+            "texts": [{"head": "^", "body": "foo"}, {"head": "^", "body": "bar"}]
+        }
+        self.assertEqual(result, expected)
+
+    def test_round_trip(self):
+        Class = self._getTarget()
+
+        class Text(Class):
+            head = self._makeString()
+            body = self._makeString()
+
+        class Form(Class):
+            texts = self._makeNested(Text, many=True)
+
+        class Ob:
+            class foo:
+                head = "^"
+                body = "foo"
+
+            class bar:
+                head = "^"
+                body = "bar"
+
+            texts = [foo, bar]
+
+        rendered = {f.name: f.value for c in Form.from_object(Ob) for f in c}
+        form = Form(rendered)
+        self.assertTrue(form.validate())
+        self.assertEqual(form.data, {"texts": [{"head": "^", "body": "foo"}, {"head": "^", "body": "bar"}]})
+        self.assertEqual(form.texts[1].body.value, "bar")
+
+    def test_max_index(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        Class = self._getTarget()
+
+        class Text(Class):
+            body = self._makeString()
+
+        class Form(Class):
+            texts = self._makeNested(Text, many=True)
+
+        form = Form({"texts.3.body": "foo"}, limits={"max_index": 2})
+        with self.assertRaises(InputTooLarge):
+            form.validate()
+
+    def test_max_list_length(self):
+        from marshmallow_form.exceptions import InputTooLarge
+        Class = self._getTarget()
+
+        class Text(Class):
+            body = self._makeString()
+
+        class Form(Class):
+            texts = self._makeNested(Text, many=True)
+
+        data = {"texts.{}.body".format(i): "foo" for i in range(4)}
+        with self.assertRaises(InputTooLarge):
+            Form(data, limits={"max_list_length": 2}).validate()
+        form = Form(data, limits={"max_list_length": 4})
+        self.assertTrue(form.validate())
+        self.assertEqual(len(form.data["texts"]), 4)
+
+
+@test_target("marshmallow_form:Form")
+class StreamingTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+
+        class CommentForm(self._getTarget()):
+            id = mf.Int()
+            text = mf.String()
+            created_at = mf.DateTime()
+
+        class ParentForm(self._getTarget()):
+            title = mf.String()
+            comments = mf.Nested(CommentForm, many=True)
+        return ParentForm(*args, **kwargs)
+
+    def _makeObject(self, n=3):
+        from collections import namedtuple
+        from datetime import datetime
+        Parent = namedtuple("Parent", "title comments")
+        Comment = namedtuple("Comment", "id text created_at")
+        now = datetime(2000, 1, 1)
+        return Parent(title="hello", comments=[Comment(id=i, text="hmm", created_at=now) for i in range(n)])
+
+    def test_items(self):
+        form = self._makeOne()
+        ob = self._makeObject()
+        items = list(form.serialize_items(ob))
+        self.assertEqual([k for k, _ in items], ["title", "comments"])
+        self.assertEqual(items[0][1], "hello")
+        self.assertEqual(list(items[1][1]), form.serialize(ob)["comments"])
+
+    def test_rows_are_dumped_lazily(self):
+        ob = self._makeObject()
+
+        def rows():
+            for c in ob.comments:
+                consumed.append(c.id)
+                yield c
+        consumed = []
+        form = self._makeOne()
+        items = dict(form.serialize_items(ob._replace(comments=rows())))
+        self.assertEqual(consumed, [])
+        it = iter(items["comments"])
+        self.assertEqual(next(it)["id"], 0)
+        self.assertEqual(consumed, [0])
+
+    def test_chunks(self):
+        import json
+        form = self._makeOne()
+        ob = self._makeObject()
+        self.assertEqual("".join(form.serialize_chunks(ob)), json.dumps(form.serialize(ob)))
+        ob = self._makeObject(n=0)
+        self.assertEqual("".join(form.serialize_chunks(ob)), json.dumps(form.serialize(ob)))
+
+    def test_error(self):
+        from marshmallow.exceptions import MarshallingError
+        form = self._makeOne()
+        ob = self._makeObject()
+        ob.comments[1] = ob.comments[1]._replace(created_at="x")
+        with self.assertRaises(MarshallingError):
+            list(form.serialize_chunks(ob))
@@ -0,0 +1,104 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+class Model(object):
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+@test_target("marshmallow_form:ModelForm")
+class ChangedFieldsTests(unittest.TestCase):
+    def _getForm(self):
+        import marshmallow_form as mf
+
+        class AuthorForm(mf.Form):
+            name = mf.String()
+            age = mf.Int()
+
+        class CommentForm(mf.Form):
+            text = mf.String()
+
+        class PostForm(self._getTarget()):
+            title = mf.String()
+            count = mf.Int()
+            author = mf.Nested(AuthorForm)
+            comments = mf.Nested(CommentForm, many=True)
+        return PostForm
+
+    def _makeModel(self):
+        return Model(title="hello", count=1, author=Model(name="foo", age=20),
+                     comments=[Model(text="a"), Model(text="b")])
+
+    def _makeOne(self, model, data, **kwargs):
+        form = self._getForm()(data, model=model, **kwargs)
+        self.assertTrue(form.validate())
+        return form
+
+    def test_unchanged(self):
+        model = self._makeModel()
+        form = self._makeOne(model, {"title": "hello", "count": "1", "author.name": "foo", "author.age": "20",
+                                     "comments.0.text": "a", "comments.1.text": "b"})
+        self.assertEqual(form.changed_fields, set())
+        self.assertEqual(form.apply_to(model), (set(), set()))
+
+    def test_changed(self):
+        model = self._makeModel()
+        form = self._makeOne(model, {"title": "hello", "count": "2", "author.name": "bar", "author.age": "20",
+                                     "comments.0.text": "a", "comments.1.text": "c"})
+        self.assertEqual(form.changed_fields, {"count", "author.name", "comments.1.text"})
+
+        author = model.author
+        self.assertEqual(form.apply_to(), ({"count", "author.name", "comments.1.text"}, set()))
+        self.assertEqual((model.title, model.count), ("hello", 2))
+        self.assertIs(model.author, author)
+        self.assertEqual((author.name, author.age), ("bar", 20))
+        self.assertEqual([c.text for c in model.comments], ["a", "c"])
+        self.assertEqual(form.changed_fields, set())
+
+    def test_rows_are_added(self):
+        model = self._makeModel()
+        form = self._makeOne(model, {"title": "hello", "count": "1", "author.name": "foo", "author.age": "20",
+                                     "comments.0.text": "a", "comments.1.text": "b", "comments.2.text": "c"})
+        self.assertEqual(form.changed_fields, {"comments"})
+        comments = model.comments
+        self.assertEqual(form.apply_to(model), (set(), {"comments"}))  # dicts are not set to the relation
+        self.assertIs(model.comments, comments)
+
+        self.assertEqual(form.apply_to(model, factories={"comments": lambda d: Model(**d)}), ({"comments"}, set()))
+        self.assertEqual([c.__class__ for c in model.comments], [Model] * 3)
+        self.assertEqual([c.text for c in model.comments], ["a", "b", "c"])
+
+    def test_relation_is_replaced(self):
+        model = self._makeModel()
+        model.author = None
+        form = self._makeOne(model, {"title": "hello", "count": "1", "author.name": "foo", "author.age": "20",
+                                     "comments.0.text": "a", "comments.1.text": "b"})
+        self.assertEqual(form.changed_fields, {"author"})
+        self.assertEqual(form.apply_to(model), (set(), {"author"}))
+        self.assertIsNone(model.author)
+        form.apply_to(model, factories={"author": lambda d: Model(**d)})
+        self.assertEqual((model.author.name, model.author.age), ("foo", 20))
+
+    def test_against_initial(self):
+        initial = {"title": "hello", "count": 0, "author": {"name": "foo", "age": 20}, "comments": [{"text": "a"}]}
+        form = self._makeOne(None, {"title": "hello", "count": "1", "author.name": "foo", "author.age": "21",
+                                    "comments.0.text": "a"}, initial=initial)
+        self.assertEqual(form.changed_fields, {"count", "author.age"})
+        d = {"title": "x", "author": {}}
+        self.assertEqual(form.apply_to(d), ({"count", "author.age"}, set()))
+        self.assertEqual(d, {"title": "x", "count": 1, "author": {"age": 21}})
+
+    def test_parent_is_missing(self):
+        initial = {"title": "hello", "count": 1, "author": {"name": "foo", "age": 20}, "comments": [{"text": "a"}]}
+        form = self._makeOne(None, {"title": "hello", "count": "2", "author.name": "foo", "author.age": "21",
+                                    "comments.0.text": "a"}, initial=initial)
+        self.assertEqual(form.changed_fields, {"count", "author.age"})
+        d = {}
+        self.assertEqual(form.apply_to(d), ({"count"}, {"author.age"}))
+        self.assertEqual(d, {"count": 2})
+
+        model = Model(title="hello", count=1, author=None, comments=[Model(text="a")])
+        self.assertEqual(form.apply_to(model), ({"count"}, {"author.age"}))
+        self.assertEqual((model.count, model.author), (2, None))
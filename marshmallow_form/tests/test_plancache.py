@@ -0,0 +1,71 @@
+# -*- coding:utf-8 -*-
+import os
+import shutil
+import tempfile
+import unittest
+from evilunit import test_target
+
+
+@test_target("marshmallow_form.plancache:PlanCache")
+class PlanCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+        self.path = os.path.join(self.dirname, "forms.plans")
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def _makeForm(self, required=False):
+        import marshmallow_form as mf
+
+        class CommentForm(mf.Form):
+            body = mf.String(required=required)
+
+        class ArticleForm(mf.Form):
+            title = mf.String()
+            comments = mf.Nested(CommentForm, many=True)
+        return ArticleForm
+
+    def test_cold_start(self):
+        cache = self._makeOne(self.path)
+        ArticleForm = self._makeForm()
+        ArticleForm.warmup(cache=cache)
+        self.assertTrue(cache.save())
+        self.assertFalse(cache.save())
+
+        cache = self._makeOne(self.path)
+        ArticleForm2 = self._makeForm()
+        ArticleForm2.warmup(cache=cache)
+        self.assertNotIn("_schema_class", ArticleForm2.__dict__)
+        self.assertFalse(cache.dirty)
+
+        plan = ArticleForm2.cleansing_plan_for({})
+        self.assertEqual(plan.as_data(), ArticleForm.cleansing_plan_for({}).as_data())
+        form = ArticleForm2({"title": "foo", "comments.0.body": "bar"})
+        self.assertEqual(form.cleansing(), {"title": "foo", "comments": [{"body": "bar"}]})
+
+    def test_definition_changed(self):
+        cache = self._makeOne(self.path)
+        self._makeForm().warmup(cache=cache)
+        cache.save()
+
+        cache = self._makeOne(self.path)
+        ArticleForm = self._makeForm(required=True)
+        ArticleForm.warmup(cache=cache)
+        self.assertTrue(cache.dirty)
+        self.assertIn("_schema_class", ArticleForm.__dict__)
+
+    def test_broken_file(self):
+        with open(self.path, "wb") as wf:
+            wf.write(b"broken")
+        cache = self._makeOne(self.path)
+        self.assertEqual(cache.entries, {})
+
+    def test_broken_entry(self):
+        cache = self._makeOne(self.path)
+        ArticleForm = self._makeForm()
+        ArticleForm.warmup(cache=cache)
+        for k in cache.entries:
+            cache.entries[k] = ([("title", ("x", ), True)], {})
+        self.assertIsNone(cache.get(ArticleForm, ((), ())))
+        self.assertEqual(cache.entries, {})
@@ -0,0 +1,168 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+class DB(object):
+    """sqlite3 with query counting. articles have lazy relations (like ORM)"""
+
+    def __init__(self, n_articles, n_children):
+        import sqlite3
+        self.conn = sqlite3.connect(":memory:")
+        self.count = 0
+        self.conn.executescript("""
+        create table article (id integer primary key, title text);
+        create table comment (id integer primary key, article_id integer, text text, user_id integer);
+        create table likes (id integer primary key, article_id integer);
+        create table user (id integer primary key, name text);
+        """)
+        self.conn.executemany("insert into user values (?, ?)", [(i, "user{}".format(i)) for i in range(n_children)])
+        for i in range(n_articles):
+            self.conn.execute("insert into article values (?, ?)", (i, "title{}".format(i)))
+            for j in range(n_children):
+                self.conn.execute("insert into comment (article_id, text, user_id) values (?, ?, ?)", (i, "hmm", j))
+                self.conn.execute("insert into likes (article_id) values (?)", (i, ))
+
+    def query(self, sql, params=()):
+        self.count += 1
+        return self.conn.execute(sql, params).fetchall()
+
+    def articles(self):
+        return [Article(self, id, title) for id, title in self.query("select id, title from article order by id")]
+
+    def group_by(self, sql, ids, make):
+        result = {id: [] for id in ids}
+        for row in self.query(sql.format(", ".join("?" * len(ids))), ids):
+            result[row[0]].append(make(*row))
+        return result
+
+
+class Article(object):
+    def __init__(self, db, id, title):
+        self.db = db
+        self.id = id
+        self.title = title
+
+    @property
+    def comments(self):  # lazy relation
+        return [Comment(self.db, *row) for row in self.db.query(
+            "select article_id, id, text, user_id from comment where article_id = ? order by id", (self.id, ))]
+
+    @property
+    def likes(self):  # lazy relation
+        return [Like(*row) for row in self.db.query(
+            "select article_id, id from likes where article_id = ? order by id", (self.id, ))]
+
+
+class Comment(object):
+    def __init__(self, db, article_id, id, text, user_id):
+        self.db = db
+        self.id = id
+        self.text = text
+        self.user_id = user_id
+
+    @property
+    def user(self):  # lazy relation
+        return User(*self.db.query("select id, name from user where id = ?", (self.user_id, ))[0])
+
+
+class Like(object):
+    def __init__(self, article_id, id):
+        self.id = id
+
+
+class User(object):
+    def __init__(self, id, name):
+        self.id = id
+        self.name = name
+
+
+def load_comments(articles):
+    db = articles[0].db
+    ids = [a.id for a in articles]
+    d = db.group_by("select article_id, id, text, user_id from comment where article_id in ({}) order by id",
+                    ids, lambda *row: Comment(db, *row))
+    return [d[id] for id in ids]
+
+
+def load_likes(articles):
+    db = articles[0].db
+    ids = [a.id for a in articles]
+    d = db.group_by("select article_id, id from likes where article_id in ({}) order by id", ids, Like)
+    return [d[id] for id in ids]
+
+
+def load_users(comments):
+    db = comments[0].db
+    ids = sorted(set(c.user_id for c in comments))
+    users = {id: User(id, name) for id, name in db.query(
+        "select id, name from user where id in ({})".format(", ".join("?" * len(ids))), ids)}
+    return [users[c.user_id] for c in comments]
+
+
+@test_target("marshmallow_form:Form")
+class FromObjectsTests(unittest.TestCase):
+    def _makeForm(self):
+        import marshmallow_form as mf
+
+        class UserForm(self._getTarget()):
+            name = mf.String()
+
+        class CommentForm(self._getTarget()):
+            id = mf.Int()
+            text = mf.String()
+            user = mf.Nested(UserForm)
+
+        class LikeForm(self._getTarget()):
+            id = mf.Int()
+
+        class ArticleForm(self._getTarget()):
+            title = mf.String()
+            comments = mf.Nested(CommentForm, many=True)
+            likes = mf.Nested(LikeForm, many=True)
+        return ArticleForm
+
+    def test_query_count(self):
+        ArticleForm = self._makeForm()
+        db = DB(100, 3)
+
+        articles = db.articles()
+        db.count = 0
+        expected = [ArticleForm.from_object(a).data for a in articles]
+        self.assertGreaterEqual(db.count, 100 * (1 + 1 + 3))  # comments, likes, and users of comments (N+1)
+
+        db.count = 0
+        loaders = {"comments": load_comments, "likes": load_likes, "comments.user": load_users}
+        forms = ArticleForm.from_objects(articles, loaders)
+        self.assertEqual(db.count, 3)
+        self.assertEqual([f.data for f in forms], expected)
+        self.assertEqual(forms[1].comments.children[2].user.name.value, "user2")
+
+    def test_without_loaders(self):
+        ArticleForm = self._makeForm()
+        db = DB(2, 1)
+        articles = db.articles()
+        forms = ArticleForm.from_objects(articles, loaders={"likes": load_likes})
+        self.assertEqual([f.data for f in forms], [ArticleForm.from_object(a).data for a in articles])
+        self.assertEqual(ArticleForm.from_objects([]), [])
+
+    def test_broken_loader(self):
+        ArticleForm = self._makeForm()
+        articles = DB(2, 1).articles()
+        with self.assertRaises(ValueError):
+            ArticleForm.from_objects(articles, loaders={"likes": lambda obs: []})
+
+    def test_child_loader_only(self):
+        # comments is not prefetched (lazy, new objects on each access). users of them are.
+        ArticleForm = self._makeForm()
+        db = DB(60, 2)
+        articles = db.articles()
+        expected = [ArticleForm.from_object(a).data for a in articles]
+
+        db.count = 0
+        forms = ArticleForm.from_objects(articles, loaders={"comments.user": load_users})
+        # comments and likes of each article (marshmallow's get_value() evaluates a property twice), users at once
+        self.assertEqual(db.count, 60 * 2 * 2 + 1)
+        self.assertEqual([f.data for f in forms], expected)
+        for f in forms:
+            self.assertEqual([c["user"]["name"] for c in f.data["comments"]], ["user0", "user1"])
@@ -0,0 +1,54 @@
+# -*- coding:utf-8 -*-
+import unittest
+from evilunit import test_target
+
+
+@test_target("marshmallow_form.registry:FormRegistry")
+class FormRegistryTests(unittest.TestCase):
+    def _makeForm(self):
+        import marshmallow_form as mf
+        from marshmallow_form.layout import Layout
+
+        class PersonForm(mf.Form):
+            name = mf.String()
+            age = mf.Int()
+
+            class Meta:
+                layout = Layout([("age", "name")])
+        return PersonForm
+
+    def test_registered(self):
+        from marshmallow_form import registry
+        PersonForm = self._makeForm()
+        self.assertIn(PersonForm, registry)
+        self.assertIn(PersonForm.variant("x", remove=["age"]), registry)
+
+    def test_warmup(self):
+        target = self._makeOne()
+        PersonForm = target.add(self._makeForm())
+        self.assertNotIn("_plans", PersonForm.__dict__)
+        self.assertEqual(target.warmup(), [PersonForm])
+        self.assertIn("_schema_class", PersonForm.__dict__)
+        self.assertEqual(len(PersonForm._plans), 1)
+        self.assertEqual(PersonForm.layout.compiled, [[("age", ), ("name", )]])
+        self.assertIs(PersonForm().cleansing_plan, PersonForm.cleansing_plan_for({}))
+        self.assertEqual([[f.name for f in row] for row in PersonForm()], [["age", "name"]])
+
+    def test_warmup__freeze(self):
+        import gc
+        if not hasattr(gc, "freeze"):
+            return
+        target = self._makeOne()
+        target.add(self._makeForm())
+        try:
+            target.warmup(freeze=True)
+            self.assertGreater(gc.get_freeze_count(), 0)
+        finally:
+            gc.unfreeze()
+
+    def test_dynamic_forms_are_collected(self):
+        import gc
+        target = self._makeOne()
+        target.add(self._makeForm())
+        gc.collect()
+        self.assertEqual(len(target), 0)
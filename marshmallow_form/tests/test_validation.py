@@ -89,3 +89,275 @@ class NestedTests(unittest.TestCase):
         self.assertEqual(form.name.value, "foo")
         self.assertEqual(form.ctime.year.value, "@@")  # default
         self.assertEqual(form.ctime.month.value, "1")  # default
+
+
+@test_target("marshmallow_form:Form")
+class JSONTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+
+        class DateTriple(self._getTarget()):
+            year = mf.Int()
+            month = mf.Int()
+            day = mf.Int()
+
+        class Text(self._getTarget()):
+            head = mf.String(required=False)
+            body = mf.String()
+
+        class FileForm(self._getTarget()):
+            name = mf.String()
+            ctime = mf.Nested(DateTriple)
+            texts = mf.Nested(Text, many=True)
+
+            class Meta:
+                json = True
+        return FileForm(*args, **kwargs)
+
+    def test_success(self):
+        input_data = {"name": "foo",
+                      "ctime": {"year": "2000", "month": "1", "day": "1"},
+                      "texts": [{"head": "h", "body": "b"}]}
+        form = self._makeOne(input_data)
+        result = form.deserialize()
+        self.assertFalse(form.has_errors())
+        expected = {"name": "foo",
+                    "ctime": {"year": 2000, "month": 1, "day": 1},
+                    "texts": [{"head": "h", "body": "b"}]}
+        self.assertEqual(result, expected)
+
+    def test_cleansing__not_copied(self):
+        input_data = {"name": "foo",
+                      "ctime": {"year": "2000", "month": "1", "day": "1"},
+                      "texts": [{"head": "h", "body": "b"}]}
+        form = self._makeOne()
+        self.assertIs(form.cleansing_json(input_data), input_data)
+
+    def test_cleansing__empty_string(self):
+        input_data = {"name": "",
+                      "ctime": {"year": "", "month": "1", "day": "1"},
+                      "texts": [{"body": "b"}, {"head": "h", "body": ""}]}
+        form = self._makeOne()
+        result = form.cleansing_json(input_data)
+        expected = {"ctime": {"month": "1", "day": "1"},
+                    "texts": [{"head": "", "body": "b"}, {"head": "h"}]}
+        self.assertEqual(result, expected)
+        self.assertEqual(input_data["name"], "")
+
+    def test_failure(self):
+        input_data = {"name": "foo", "ctime": {"year": "@@", "month": "1", "day": "1"}, "texts": []}
+        form = self._makeOne(input_data)
+        self.assertFalse(form.validate())
+        self.assertTrue(form.ctime.year.errors)
+
+    def test_flat_form__json_option(self):
+        import marshmallow_form as mf
+
+        class PersonForm(self._getTarget()):
+            name = mf.String()
+            age = mf.Integer()
+
+        form = PersonForm()
+        result = form.deserialize({"name": "foo", "age": ""}, json=True)
+        self.assertEqual(list(form.errors.keys()), ["age"])
+        self.assertEqual(result["name"], "foo")
+
+
+@test_target("marshmallow_form:Form")
+class ReuseTests(unittest.TestCase):
+    def _makeOne(self, *args, **kwargs):
+        import marshmallow_form as mf
+
+        class DateTriple(self._getTarget()):
+            year = mf.Int()
+            month = mf.Int()
+            day = mf.Int()
+
+        class Text(self._getTarget()):
+            body = mf.String()
+
+        class FileForm(self._getTarget()):
+            name = mf.String()
+            ctime = mf.Nested(DateTriple)
+            texts = mf.Nested(Text, many=True)
+        return FileForm(*args, **kwargs)
+
+    def test_value_after_deserialize(self):
+        form = self._makeOne()
+        name, year = form.name, form.ctime.year
+        self.assertEqual((name.value, year.value), ("", 0))
+        form.deserialize({"name": "foo", "ctime.year": "2000", "ctime.month": "1", "ctime.day": "1"})
+        self.assertEqual((name.value, year.value), ("foo", 2000))
+        self.assertIs(form.ctime.year, year)
+
+    def test_errors_after_deserialize(self):
+        form = self._makeOne()
+        year = form.ctime.year
+        form.deserialize({"name": "foo", "ctime.year": "@@", "ctime.month": "1", "ctime.day": "1"})
+        self.assertTrue(year.errors)
+        form.deserialize({"name": "foo", "ctime.year": "2000", "ctime.month": "1", "ctime.day": "1"})
+        self.assertFalse(form.ctime.year.errors)
+        self.assertFalse(year.errors)
+
+    def test_nested_list_after_deserialize(self):
+        form = self._makeOne()
+        texts = form.texts
+        self.assertEqual(len(list(texts)), 0)
+        form.deserialize({"texts.0.body": "foo", "texts.1.body": "bar"})
+        self.assertEqual([c.body.value for c in texts], ["foo", "bar"])
+
+
+@test_target("marshmallow_form:ValidationCache")
+class ValidationCacheTests(unittest.TestCase):
+    def _makeForm(self, cache, cacheable=True):
+        import marshmallow_form as mf
+        calls = self.calls = []
+
+        def check_name(name):
+            calls.append(name)
+            return name != "bad"
+        if not cacheable:
+            mf.uncacheable(check_name)
+
+        class PersonForm(mf.Form):
+            validation_cache = cache
+            name = mf.String(validate=check_name)
+            age = mf.Integer()
+        return PersonForm
+
+    def _makeOne(self, **kwargs):
+        self.now = 0
+        return self._getTarget()(timer=lambda: self.now, **kwargs)
+
+    def test_hit(self):
+        cache = self._makeOne()
+        Form = self._makeForm(cache)
+        self.assertEqual(Form({"name": "foo", "age": "10"}).deserialize(), {"name": "foo", "age": 10})
+        form = Form({"age": "10", "name": "foo"})
+        result = form.deserialize()
+        self.assertEqual(result, {"name": "foo", "age": 10})
+        self.assertEqual(self.calls, ["foo"])
+        self.assertEqual(len(cache), 1)
+
+        result["age"] = 20  # cached result is not shared
+        self.assertEqual(Form({"name": "foo", "age": "10"}).deserialize(), {"name": "foo", "age": 10})
+
+    def test_errors_are_cached(self):
+        Form = self._makeForm(self._makeOne())
+        for _ in range(2):
+            form = Form({"name": "bad", "age": "10"})
+            self.assertFalse(form.validate())
+            self.assertEqual(list(form.errors.keys()), ["name"])
+        self.assertEqual(self.calls, ["bad"])
+
+    def test_keyed_by_type(self):
+        cache = self._makeOne()
+        Form = self._makeForm(cache)
+        results = [Form({"name": v, "age": "10"}).deserialize(cleansing=False)["name"] for v in (1, True, 1.0)]
+        self.assertEqual(results, ["1", "True", "1.0"])
+        self.assertEqual(len(cache), 3)
+
+    def test_key_is_digest(self):
+        cache = self._makeOne()
+        Form = self._makeForm(cache)
+        Form({"name": "x" * 10000, "age": "10"}).deserialize()
+        key, = cache.entries.data.keys()
+        self.assertLess(len(repr(key)), 1000)
+        self.assertIs(key[0], Form)
+
+    def test_keyed_by_options(self):
+        Form = self._makeForm(self._makeOne())
+        Form({"name": "foo", "age": "10"}).deserialize()
+        self.assertEqual(Form({"name": "foo", "age": "10"}, options={"exclude": ["age"]}).deserialize(), {"name": "foo"})
+        self.assertEqual(self.calls, ["foo", "foo"])
+
+    def test_ttl_and_maxsize(self):
+        cache = self._makeOne(ttl=10, maxsize=2)
+        Form = self._makeForm(cache)
+        Form({"name": "foo", "age": "10"}).deserialize()
+        self.now = 10
+        Form({"name": "foo", "age": "10"}).deserialize()
+        self.assertEqual(self.calls, ["foo", "foo"])
+        Form({"name": "bar", "age": "10"}).deserialize()
+        Form({"name": "boo", "age": "10"}).deserialize()
+        self.assertEqual(len(cache), 2)
+
+    def test_uncacheable(self):
+        cache = self._makeOne()
+        Form = self._makeForm(cache, cacheable=False)
+        Form({"name": "foo", "age": "10"}).deserialize()
+        Form({"name": "foo", "age": "10"}).deserialize()
+        self.assertEqual(self.calls, ["foo", "foo"])
+        self.assertEqual(len(cache), 0)
+
+    def test_uncacheable_schema_validator(self):
+        import marshmallow_form as mf
+        cache = self._makeOne()
+        calls = []
+
+        class Form(mf.Form):
+            validation_cache = cache
+            name = mf.String()
+
+            @mf.Form.validator
+            @mf.uncacheable
+            def check(schema, data):
+                calls.append(data)
+                return True
+        Form({"name": "foo"}).deserialize()
+        Form({"name": "foo"}).deserialize()
+        self.assertEqual(len(calls), 2)
+
+
+@test_target("marshmallow_form:Form")
+class ValidationContextTests(unittest.TestCase):
+    def _makeForm(self):
+        import marshmallow_form as mf
+        from marshmallow import ValidationError
+        queries = self.queries = []
+        contexts = self.contexts = []
+
+        def load_account(email):
+            queries.append(email)
+            return {"taken": email == "taken@example.com", "quota": 1}
+
+        @mf.with_context
+        def unique(email, ctx):
+            contexts.append(ctx)
+            return not ctx.memo(("account", email), lambda: load_account(email))["taken"]
+
+        class SignupForm(self._getTarget()):
+            email = mf.String(validate=unique)
+            count = mf.Int()
+
+            @mf.Form.validator
+            @mf.with_context
+            def quota(schema, data, ctx):
+                contexts.append(ctx)
+                account = ctx.memo(("account", data["email"]), lambda: load_account(data["email"]))
+                if data["count"] > account["quota"]:
+                    raise ValidationError("over quota", "count")
+        return SignupForm
+
+    def test_memo_is_shared_in_one_run(self):
+        Form = self._makeForm()
+        form = Form({"email": "foo@example.com", "count": "2"})
+        self.assertFalse(form.validate())
+        self.assertEqual(form.errors, {"count": ["over quota"]})
+        self.assertEqual(self.queries, ["foo@example.com"])
+        self.assertEqual(len(self.contexts), 2)
+        self.assertIs(self.contexts[0], self.contexts[1])
+
+    def test_memo_is_not_shared_between_runs(self):
+        from marshmallow_form import current_context
+        Form = self._makeForm()
+        Form({"email": "foo@example.com", "count": "1"}).validate()
+        Form({"email": "foo@example.com", "count": "1"}).validate()
+        self.assertEqual(self.queries, ["foo@example.com"] * 2)
+        self.assertIsNot(self.contexts[0], self.contexts[2])
+        self.assertIsNone(current_context())
+
+    def test_outside_of_load(self):
+        Form = self._makeForm()
+        validator = Form.Schema().fields["email"].validators[0]
+        self.assertFalse(validator("taken@example.com"))
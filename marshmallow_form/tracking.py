@@ -0,0 +1,85 @@
+# -*- coding:utf-8 -*-
+from marshmallow.compat import basestring
+
+MARKER = object()
+
+
+def get_item(ob, k, default=MARKER):
+    if isinstance(ob, dict):
+        return ob.get(k, default)
+    if isinstance(ob, (list, tuple)):
+        try:
+            return ob[int(k)]
+        except (IndexError, ValueError):
+            return default
+    return getattr(ob, k, default)
+
+
+def set_item(ob, k, v):
+    if isinstance(ob, (dict, list)):
+        ob[int(k) if isinstance(ob, list) else k] = v
+    else:
+        setattr(ob, k, v)
+
+
+def get_path(ob, path, default=MARKER):
+    for k in path.split("."):
+        ob = get_item(ob, k)
+        if ob is MARKER:
+            return default
+    return ob
+
+
+def field_for_path(schema, path):
+    """the field of a dotted path (row indexes are skipped). None if not found"""
+    field = None
+    for k in path.split("."):
+        if k.isdigit():
+            continue
+        if field is not None:
+            if not hasattr(field, "nested"):
+                return None
+            schema = field.schema
+        field = next((f for name, f in schema.fields.items() if (f.attribute or name) == k), None)
+        if field is None:
+            return None
+    return field
+
+
+def is_relation(field):
+    """the value is a (list of) deserialized dict, for Nested fields"""
+    return hasattr(field, "nested") and not isinstance(field.only, basestring)
+
+
+def changed_paths(schema, data, base, prefix="", result=None):
+    """dotted paths of data (deserialized) different from base (initial dict or model object).
+    leaves are compared by identity, then by equality.
+    rows of Nested(many=True) are compared one by one if the number of rows is not changed
+    """
+    if result is None:
+        result = set()
+    fields = {(f.attribute or name): f for name, f in schema.fields.items()}
+    for k, v in data.items():
+        old = get_item(base, k)
+        if v is old:
+            continue
+        path = prefix + k
+        field = fields.get(k)
+        if old is MARKER or old is None or field is None or not hasattr(field, "nested") \
+           or isinstance(field.only, basestring):
+            if old is MARKER or v != old:
+                result.add(path)
+        elif not field.many:
+            if isinstance(v, dict):
+                changed_paths(field.schema, v, old, path + ".", result)
+            else:
+                result.add(path)
+        elif isinstance(v, (list, tuple)) and len(v) == len(old):
+            for i, (row, oldrow) in enumerate(zip(v, old)):
+                if isinstance(row, dict):
+                    changed_paths(field.schema, row, oldrow, "{}.{}.".format(path, i), result)
+                elif row != oldrow:
+                    result.add("{}.{}".format(path, i))
+        else:
+            result.add(path)
+    return result
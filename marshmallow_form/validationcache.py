@@ -0,0 +1,120 @@
+# -*- coding:utf-8 -*-
+import copy
+import time
+import hashlib
+import threading
+from .langhelpers import LRUCache
+
+
+def uncacheable(fn):
+    """marking a validator (or preprocessor) as non-cacheable. (e.g. checking the DB)
+    the forms using it are always validated. (put beneath ``@Form.validator``)
+    """
+    fn.cacheable = False
+    return fn
+
+
+_scalars = (str, bytes, int, float, bool, type(None))
+
+
+def _encode(v, out):
+    # type-tagged (1, True and 1.0 are different), dict keys are sorted
+    if hasattr(v, "items"):
+        out.append("{")
+        out.extend(sorted(_canonical(k) + ":" + _canonical(x) + "," for k, x in v.items()))
+        out.append("}")
+    elif isinstance(v, (list, tuple)):
+        out.append("[")
+        for x in v:
+            _encode(x, out)
+            out.append(",")
+        out.append("]")
+    elif isinstance(v, _scalars):
+        out.append("{}({!r})".format(v.__class__.__name__, v))
+    else:
+        raise TypeError("not cacheable: {!r}".format(v.__class__))
+
+
+def _canonical(v):
+    out = []
+    _encode(v, out)
+    return "".join(out)
+
+
+def digest(v):
+    """digest of canonical encoding of v (nested dict/list of str, bytes, int, float, bool, None).
+    raising TypeError for other values"""
+    return hashlib.sha1(_canonical(v).encode("utf-8", "surrogatepass")).digest()
+
+
+def is_cacheable(schema):
+    for fn in (schema.__validators__ or ()):
+        if not getattr(fn, "cacheable", True):
+            return False
+    for fn in (schema.__preprocessors__ or ()):
+        if not getattr(fn, "cacheable", True):
+            return False
+    for _, fn in (getattr(schema, "__batch_validators__", None) or ()):
+        if not getattr(fn, "cacheable", True):
+            return False
+    for f in schema.fields.values():
+        for fn in (getattr(f, "validators", None) or ()):
+            if not getattr(fn, "cacheable", True):
+                return False
+        if hasattr(f, "nested") and not is_cacheable(f.schema):
+            return False
+    return True
+
+
+class ValidationCache(object):
+    """load() results of recently validated data, keyed by form class, options and digest of cleansed data.
+    entries are expired after ttl seconds. (opt-in: ``validation_cache = ValidationCache()`` in form class)
+    """
+
+    def __init__(self, maxsize=1024, ttl=60, timer=time.monotonic):
+        self.ttl = ttl
+        self.timer = timer
+        self.entries = LRUCache(maxsize)
+        self.cacheable = {}  # {(class, options): bool}
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def key(self, form, schema, data):
+        """None if not cacheable"""
+        if "_names" in form.__dict__:  # modified by add_field() or remove_field()
+            return None
+        try:
+            options = digest(form.options)
+            data_digest = digest(data)
+        except TypeError:
+            return None
+        k = (form.__class__, options)
+        cacheable = self.cacheable.get(k)
+        if cacheable is None:
+            cacheable = self.cacheable[k] = is_cacheable(schema)
+        if not cacheable:
+            return None
+        return (form.__class__, options, data_digest)
+
+    def load(self, form, schema, data):
+        key = self.key(form, schema, data)
+        if key is None:
+            return schema.load(data)
+        now = self.timer()
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= now:
+                self.entries.pop(key)
+                entry = None
+        if entry is not None:
+            return copy.deepcopy(entry[1])
+        result = schema.load(data)
+        with self.lock:
+            self.entries[key] = (now + self.ttl, copy.deepcopy(result))
+        return result
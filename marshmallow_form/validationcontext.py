@@ -0,0 +1,48 @@
+# -*- coding:utf-8 -*-
+import contextvars
+from functools import wraps
+
+_current = contextvars.ContextVar("marshmallow_form.validation_context", default=None)
+
+
+class ValidationContext(object):
+    """per-validation-run state (one for each load()), shared by all validators of the run"""
+
+    def __init__(self):
+        self.memos = {}
+
+    def memo(self, key, fn):
+        """fn() is called once per run for each key (e.g. loading the same account for several checks)"""
+        try:
+            return self.memos[key]
+        except KeyError:
+            v = self.memos[key] = fn()
+            return v
+
+
+def current_context():
+    """context of the running validation. None, outside of load()"""
+    return _current.get()
+
+
+class activate(object):
+    def __init__(self, ctx=None):
+        self.ctx = ctx or ValidationContext()
+
+    def __enter__(self):
+        self.token = _current.set(self.ctx)
+        return self.ctx
+
+    def __exit__(self, *exc):
+        _current.reset(self.token)
+
+
+def with_context(fn):
+    """passing the context of the running validation as `ctx` keyword argument.
+    usable for field validators and schema validators (``@Form.validator``)
+    """
+    @wraps(fn)
+    def wrapped(*args, **kwargs):
+        kwargs["ctx"] = _current.get() or ValidationContext()
+        return fn(*args, **kwargs)
+    return wrapped
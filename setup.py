@@ -30,6 +30,10 @@ tests_require = [
 testing_extras = tests_require + [
 ]
 
+fast_extras = [
+    "orjson",
+]
+
 setup(name='marshmallow-form',
       version='0.1.1',
       description='a wrapper of marshmallow for form library like behavior',
@@ -49,6 +53,7 @@ setup(name='marshmallow-form',
       extras_require={
           'testing': testing_extras,
           'docs': docs_extras,
+          'fast': fast_extras,
       },
       tests_require=tests_require,
       test_suite="marshmallow_form.tests",